@@ -0,0 +1 @@
+"""Benchmarks for the plant care advisory functions. Run from the repo root."""
@@ -0,0 +1,86 @@
+"""Measure the validation work saved by the validated-once fast path.
+
+    python -m benchmarks.fast_path
+"""
+
+import timeit
+
+import care_rules
+
+READING = (2, 2, 35.0, 80)
+
+
+def check_integer(value, message):
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(message)
+
+
+def checked_watering_days(plant_type):
+    check_integer(plant_type, "Plant type must be an integer.")
+    if not 1 <= plant_type <= 4:
+        raise ValueError("Invalid plant type. Must be between 1 and 4.")
+    return care_rules.watering_days(plant_type)
+
+
+def checked_season_days(days, season):
+    check_integer(season, "Season must be an integer.")
+    if not 1 <= season <= 4:
+        raise ValueError("Invalid season. Must be between 1 and 4.")
+    check_integer(days, "Days must be an integer.")
+    if days < 0:
+        raise ValueError("Base schedule cannot be negative.")
+    return care_rules.season_adjusted_days(days, season)
+
+
+def checked_temperature_band(temperature):
+    if isinstance(temperature, bool) or not isinstance(temperature, (int, float)):
+        raise ValueError("Temperature must be a number.")
+    if not care_rules.MIN_TEMPERATURE <= temperature <= care_rules.MAX_TEMPERATURE:
+        raise ValueError("Temperature must be between -10.0 and 50.0 Celsius.")
+    return care_rules.temperature_band(temperature)
+
+
+def checked_humidity_band(humidity):
+    check_integer(humidity, "Humidity must be an integer.")
+    if not care_rules.MIN_HUMIDITY <= humidity <= care_rules.MAX_HUMIDITY:
+        raise ValueError("Humidity must be between 0 and 100 percent.")
+    return care_rules.humidity_band(humidity)
+
+
+def checked_sunlight(plant_type):
+    check_integer(plant_type, "Plant type must be an integer.")
+    if not 1 <= plant_type <= 4:
+        raise ValueError("Invalid plant type. Must be between 1 and 4.")
+    return care_rules.sunlight_requirement(plant_type)
+
+
+def validated_per_helper(plant_type, season, temperature, humidity):
+    """generate_care_instructions composed of helpers that each validate their own input.
+
+    The reading is validated up front, then again piecewise by every helper,
+    as the skeleton's structure does; the rendering is the same as advise(),
+    so the difference between the two paths is the repeated validation.
+    """
+    care_rules.validate_reading(plant_type, season, temperature, humidity)
+    return care_rules.render_advice(
+        checked_season_days(checked_watering_days(plant_type), season),
+        checked_sunlight(plant_type),
+        care_rules.PLANT_CARE[plant_type - 1],
+        season,
+        checked_temperature_band(temperature),
+        checked_humidity_band(humidity),
+    )
+
+
+def main(number: int = 200000):
+    """Print per-call latency of both paths and the saved fraction."""
+    assert validated_per_helper(*READING) == care_rules.advise(*READING)
+    fast = min(timeit.repeat(lambda: care_rules.advise(*READING), number=number, repeat=5)) / number
+    slow = min(timeit.repeat(lambda: validated_per_helper(*READING), number=number, repeat=5)) / number
+    print(f"validated once:      {fast * 1e9:8.1f} ns/call")
+    print(f"validated per helper:{slow * 1e9:8.1f} ns/call")
+    print(f"saved:               {(1 - fast / slow) * 100:8.1f} %")
+
+
+if __name__ == "__main__":
+    main()
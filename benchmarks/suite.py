@@ -0,0 +1,190 @@
+"""Micro and macro benchmarks for the advisory functions and batch paths.
+
+    python -m benchmarks [--fleets 1000 100000 1000000] [--json results.json]
+
+Micro benchmarks time each scalar function over repeated batches of calls and
+report per-call latency percentiles. Macro benchmarks evaluate synthetic
+fleets through the batch paths. Every result carries ops/sec and the peak
+memory traced over one extra untimed call; the JSON report includes the git commit so runs
+can be compared across revisions.
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import care_batch
+import care_engine
+import care_parallel
+import care_records
+import care_rules
+import care_table
+import skeleton
+
+READING = (2, 2, 35.0, 80)
+
+MICRO_CASES = [
+    ("skeleton.calculate_watering_schedule", skeleton.calculate_watering_schedule, (2,)),
+    ("skeleton.adjust_for_season", skeleton.adjust_for_season, (3, 2)),
+    ("skeleton.check_temperature", skeleton.check_temperature, (35.0,)),
+    ("skeleton.determine_humidity_needs", skeleton.determine_humidity_needs, (80,)),
+    ("skeleton.get_sunlight_requirement", skeleton.get_sunlight_requirement, (2,)),
+    ("skeleton.generate_care_instructions", skeleton.generate_care_instructions, READING),
+    ("care_rules.advise", care_rules.advise, READING),
+    ("care_rules.evaluate_fields", care_rules.evaluate_fields, READING),
+    ("care_table.generate_care_instructions", care_table.generate_care_instructions, READING),
+    ("care_records.generate_advice", care_records.generate_advice, READING),
+    ("care_engine.generate_care_instructions", care_engine.default_engine().generate_care_instructions, READING),
+]
+
+DEFAULT_FLEETS = (1000, 100000, 1000000)
+
+
+def percentiles(samples) -> dict:
+    """Return p50/p90/p99/max of latency samples in nanoseconds."""
+    values = np.asarray(samples) * 1e9
+    p50, p90, p99 = np.percentile(values, [50, 90, 99])
+    return {"p50_ns": float(p50), "p90_ns": float(p90), "p99_ns": float(p99), "max_ns": float(values.max())}
+
+
+def traced_peak(func, *args) -> int:
+    """Peak bytes allocated during one call, measured separately from timing."""
+    tracemalloc.start()
+    try:
+        func(*args)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_call(func, args, number: int = 1000, repeat: int = 200) -> dict:
+    """Time func(*args) in `repeat` samples of `number` calls each."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func(*args)
+        samples.append((time.perf_counter() - start) / number)
+    result = {"ops_per_sec": 1 / min(samples), "peak_memory_bytes": traced_peak(func, *args)}
+    result.update(percentiles(samples))
+    return result
+
+
+def synthetic_fleet(size: int, seed: int = 0) -> tuple:
+    """Random valid readings as parallel arrays."""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.integers(1, 5, size, dtype=np.uint8),
+        rng.integers(1, 5, size, dtype=np.uint8),
+        np.round(rng.uniform(care_rules.MIN_TEMPERATURE, care_rules.MAX_TEMPERATURE, size), 1),
+        rng.integers(0, 101, size, dtype=np.uint8),
+    )
+
+
+def bench_fleet(func, size: int, repeat: int = 5) -> dict:
+    """Time one whole-fleet call of func, which receives a prepared fleet."""
+    fleet = synthetic_fleet(size)
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(fleet)
+        samples.append(time.perf_counter() - start)
+    result = {"plants": size, "ops_per_sec": size / min(samples), "peak_memory_bytes": traced_peak(func, fleet)}
+    result.update(percentiles(samples))
+    return result
+
+
+def _records_path(fleet):
+    plant_type, season, temperature, humidity = fleet
+    readings = np.empty(plant_type.size, dtype=care_records.READING_DTYPE)
+    readings["plant_type"] = plant_type
+    readings["season"] = season
+    readings["temperature"] = care_records.to_tenths_array(temperature)
+    readings["humidity"] = humidity
+    return care_records.evaluate_array(readings)
+
+
+def _parallel_path(fleet):
+    return care_parallel.evaluate_parallel(np.arange(fleet[0].size), *fleet)
+
+
+def _table_path(fleet):
+    generate = care_table.generate_care_instructions
+    return [generate(*row) for row in zip(*(column.tolist() for column in fleet))]
+
+
+MACRO_CASES = [
+    ("care_batch.evaluate_batch", lambda fleet: care_batch.evaluate_batch(*fleet)),
+    ("care_batch.evaluate_batch[watering_days]",
+     lambda fleet: care_batch.evaluate_batch(*fleet, fields={"watering_days"})),
+    ("care_records.evaluate_array", _records_path),
+    ("care_parallel.evaluate_parallel", _parallel_path),
+    ("care_table.generate_care_instructions (loop)", _table_path),
+]
+
+
+def git_revision() -> str:
+    """Return the current commit hash, or None outside a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(fleets=DEFAULT_FLEETS, number: int = 1000, repeat: int = 200) -> dict:
+    """Run every benchmark and return the report."""
+    report = {
+        "commit": git_revision(),
+        "python": sys.version.split()[0],
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "micro": {},
+        "macro": {},
+    }
+    for name, func, args in MICRO_CASES:
+        report["micro"][name] = bench_call(func, args, number, repeat)
+    for name, func in MACRO_CASES:
+        report["macro"][name] = [bench_fleet(func, size) for size in fleets]
+    return report
+
+
+def print_report(report: dict):
+    """Print a human-readable summary of a report."""
+    print(f"commit {report['commit']}  python {report['python']}  numpy {report['numpy']}")
+    print("\nMicro benchmarks (per call)")
+    for name, result in report["micro"].items():
+        print(f"  {name:42} {result['ops_per_sec']:>14,.0f} ops/s  p50 {result['p50_ns']:8.0f} ns  "
+              f"p99 {result['p99_ns']:8.0f} ns  peak {result['peak_memory_bytes']:>10,} B")
+    print("\nMacro benchmarks (per fleet)")
+    for name, results in report["macro"].items():
+        for result in results:
+            print(f"  {name:42} {result['plants']:>9,} plants {result['ops_per_sec']:>14,.0f} plants/s  "
+                  f"p50 {result['p50_ns'] / 1e6:9.2f} ms  peak {result['peak_memory_bytes']:>13,} B")
+
+
+def main(argv=None):
+    """Command-line entry point for the benchmark suite."""
+    parser = argparse.ArgumentParser(description="Benchmark the plant care advisory functions.")
+    parser.add_argument("--fleets", type=int, nargs="+", default=list(DEFAULT_FLEETS), help="fleet sizes")
+    parser.add_argument("--number", type=int, default=1000, help="calls per micro-benchmark sample")
+    parser.add_argument("--repeat", type=int, default=200, help="samples per micro-benchmark")
+    parser.add_argument("--json", help="write the report as JSON to this path")
+    args = parser.parse_args(argv)
+
+    report = run(args.fleets, args.number, args.repeat)
+    print_report(report)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Configurable sensor bands compiled to sorted boundary arrays.
+
+A band table is a list of thresholds such as [(">=", 10.0), (">", 30.0)]; a
+value's band is the number of thresholds it passes. Each threshold compiles
+to an "at or above" edge (a ">" threshold becomes the next float up), so the
+band of a value is bisect_right over the edges for one reading and
+np.searchsorted(..., side="right") for an array. Tables with extra bands, for
+example frost below 0 °C or extreme heat above 40 °C, classify with the same
+single search, and each band carries its own status and advice text.
+"""
+
+import bisect
+import functools
+import math
+
+import numpy as np
+
+import care_rules
+
+OPERATORS = (">=", ">")
+# Distinct boundary pairs kept by temperature_table and humidity_table
+TABLE_CACHE_SIZE = 256
+
+
+def compile_edges(thresholds) -> tuple[float, ...]:
+    """Turn (operator, value) thresholds into strictly ascending at-or-above edges."""
+    edges = []
+    for operator, value in thresholds:
+        if operator not in OPERATORS:
+            raise ValueError(f"Band operator must be one of {', '.join(OPERATORS)}.")
+        edge = float(value) if operator == ">=" else math.nextafter(float(value), math.inf)
+        if edges and edge <= edges[-1]:
+            raise ValueError("Band thresholds must be ascending.")
+        edges.append(edge)
+    return tuple(edges)
+
+
+class BandTable:
+    """Sorted band edges with a label and an optional advice text per band."""
+    __slots__ = ("thresholds", "edges", "edges_array", "labels", "advice")
+
+    def __init__(self, thresholds, labels, advice):
+        self.thresholds = tuple((operator, value) for operator, value in thresholds)
+        self.edges = compile_edges(self.thresholds)
+        if len(labels) != len(self.edges) + 1 or len(advice) != len(labels):
+            raise ValueError("A band table needs one label and one advice entry per band.")
+        self.edges_array = np.array(self.edges, dtype=np.float64)
+        self.labels = tuple(labels)
+        self.advice = tuple(advice)
+
+    def __eq__(self, other):
+        if not isinstance(other, BandTable):
+            return NotImplemented
+        return (self.edges, self.labels, self.advice) == (other.edges, other.labels, other.advice)
+
+    def __hash__(self):
+        return hash((self.edges, self.labels, self.advice))
+
+    def __len__(self) -> int:
+        return len(self.labels)
+
+    def classify(self, value) -> int:
+        """Band of one value."""
+        return bisect.bisect_right(self.edges, value)
+
+    def classify_array(self, values) -> np.ndarray:
+        """Bands of an array of values."""
+        return np.searchsorted(self.edges_array, values, side="right").astype(np.uint8)
+
+
+@functools.lru_cache(maxsize=TABLE_CACHE_SIZE)
+def temperature_table(low: float = care_rules.LOW_TEMPERATURE, high: float = care_rules.HIGH_TEMPERATURE) -> BandTable:
+    """The SRS low/optimal/high temperature bands with the given boundaries (shared per recent boundary pair)."""
+    return BandTable([(">=", low), (">", high)], care_rules.TEMPERATURE_STATUS, care_rules.TEMPERATURE_CARE)
+
+
+@functools.lru_cache(maxsize=TABLE_CACHE_SIZE)
+def humidity_table(low: int = care_rules.LOW_HUMIDITY, high: int = care_rules.HIGH_HUMIDITY) -> BandTable:
+    """The SRS low/medium/high humidity bands with the given boundaries (shared per recent boundary pair)."""
+    levels, advice = zip(*care_rules.HUMIDITY_NEEDS)
+    return BandTable([(">=", low), (">", high)], levels, advice)
+
+
+def render(watering_days: int, sunlight: str, plant_care: str, temperature_bands: BandTable,
+           humidity_bands: BandTable, season: int, temperature: float, humidity: int) -> str:
+    """Format instructions for a reading classified by the given band tables."""
+    temp_band = temperature_bands.classify(temperature)
+    hum_band = humidity_bands.classify(humidity)
+    return care_rules.format_instructions(
+        care_rules.season_adjusted_days(watering_days, season), sunlight, plant_care, season,
+        temperature_bands.labels[temp_band], temperature_bands.advice[temp_band],
+        humidity_bands.labels[hum_band], humidity_bands.advice[hum_band],
+    )
+
+
+def classify_grouped(tables, table_index, values) -> np.ndarray:
+    """Band codes for values where row i is classified by tables[table_index[i]].
+
+    Rows are grouped by table with one stable argsort, so each distinct table
+    costs one np.searchsorted over its rows however many rows there are.
+    """
+    table_index = np.asarray(table_index).ravel()
+    values = np.asarray(values).ravel()
+    if len(tables) == 1:
+        return tables[0].classify_array(values)
+    order = np.argsort(table_index, kind="stable")
+    starts = np.searchsorted(table_index[order], np.arange(len(tables) + 1))
+    bands = np.empty(values.size, dtype=np.uint8)
+    for table in np.flatnonzero(np.diff(starts)):
+        rows = order[starts[table]:starts[table + 1]]
+        bands[rows] = tables[table].classify_array(values[rows])
+    return bands
@@ -0,0 +1,88 @@
+"""Vectorized batch evaluation of plant care advice over NumPy arrays."""
+
+import numpy as np
+
+import care_rules
+
+WATERING_DAYS = np.array(care_rules.WATERING_DAYS, dtype=np.int16)
+
+FIELDS = care_rules.FIELDS
+
+
+def as_integer_array(values, message: str) -> np.ndarray:
+    """Convert values to a 1-D integer array or raise ValueError."""
+    array = np.asarray(values)
+    if not np.issubdtype(array.dtype, np.integer):
+        raise ValueError(message)
+    return array.ravel()
+
+
+def validate_batch(plant_type, season, temperature, humidity) -> tuple:
+    """Validate parallel input arrays with the rules of generate_care_instructions."""
+    plant_type = as_integer_array(plant_type, "Plant type must be an integer.")
+    if plant_type.size and (plant_type.min() < 1 or plant_type.max() > 4):
+        raise ValueError("Invalid plant type")
+    season = as_integer_array(season, "Season must be an integer.")
+    if season.size and (season.min() < 1 or season.max() > 4):
+        raise ValueError("Invalid season")
+    temperature = np.asarray(temperature).ravel()
+    if temperature.dtype == np.bool_ or not np.issubdtype(temperature.dtype, np.number):
+        raise ValueError("Temperature must be a number.")
+    if temperature.size and not (
+        (temperature >= care_rules.MIN_TEMPERATURE) & (temperature <= care_rules.MAX_TEMPERATURE)
+    ).all():
+        raise ValueError("Invalid temperature")
+    humidity = as_integer_array(humidity, "Humidity must be an integer.")
+    if humidity.size and (humidity.min() < care_rules.MIN_HUMIDITY or humidity.max() > care_rules.MAX_HUMIDITY):
+        raise ValueError("Invalid humidity")
+    if not plant_type.size == season.size == temperature.size == humidity.size:
+        raise ValueError("Input arrays must have the same length.")
+    return plant_type, season, temperature, humidity
+
+
+def season_adjusted_days(days: np.ndarray, season: np.ndarray) -> np.ndarray:
+    """Vectorized adjust_for_season."""
+    return np.where(season == 2, np.maximum(days - 1, 1), np.where(season == 4, days + 1, days))
+
+
+def temperature_bands(temperature: np.ndarray) -> np.ndarray:
+    """Vectorized temperature band codes (see care_rules.BAND_*)."""
+    return (temperature >= care_rules.LOW_TEMPERATURE).astype(np.uint8) + (temperature > care_rules.HIGH_TEMPERATURE)
+
+
+def humidity_bands(humidity: np.ndarray) -> np.ndarray:
+    """Vectorized humidity band codes (see care_rules.BAND_*)."""
+    return (humidity >= care_rules.LOW_HUMIDITY).astype(np.uint8) + (humidity > care_rules.HIGH_HUMIDITY)
+
+
+def evaluate_batch(plant_type, season, temperature, humidity, fields=None) -> dict[str, np.ndarray]:
+    """Evaluate care advice for parallel input arrays in one pass.
+
+    Returns columnar results keyed by FIELDS, or only by the names in fields
+    when given; unselected columns are not computed. Watering days are
+    integers; the other columns are codes indexing the care_rules text tables.
+    """
+    selected = care_rules.check_fields(fields)
+    plant_type, season, temperature, humidity = validate_batch(plant_type, season, temperature, humidity)
+    results = {}
+    if "watering_days" in selected:
+        results["watering_days"] = season_adjusted_days(WATERING_DAYS[plant_type - 1], season)
+    if "temperature_status" in selected:
+        results["temperature_status"] = temperature_bands(temperature)
+    if "humidity_level" in selected:
+        results["humidity_level"] = humidity_bands(humidity)
+    if "sunlight_requirement" in selected:
+        results["sunlight_requirement"] = (plant_type - 1).astype(np.uint8)
+    return results
+
+
+def render_batch(plant_type, season, results: dict[str, np.ndarray]):
+    """Yield the care instruction text for each row of evaluate_batch results."""
+    rows = zip(
+        np.asarray(plant_type).ravel().tolist(),
+        np.asarray(season).ravel().tolist(),
+        results["temperature_status"].tolist(),
+        results["humidity_level"].tolist(),
+    )
+    for row in rows:
+        yield care_rules.render_instructions(*row)
@@ -0,0 +1,172 @@
+"""Compact species catalog file with an offset index and lazy, cached reads.
+
+File layout (little-endian):
+
+    header   magic b"PCARCATL", uint16 version, uint16 reserved, uint32 species count
+    ids      uint32 species ids in ascending order, padded to a multiple of 8 bytes
+    offsets  count + 1 uint64 file offsets; entry i spans offsets[i]:offsets[i + 1]
+    entries  ENTRY struct followed by the UTF-8 name, sunlight and care texts
+
+Opening a catalog maps the file and reads only the header, so it takes the
+same time for four species or a million. An entry is decoded on first access
+(a binary search of the id array, then one struct unpack) and kept, with its
+compiled care_bands tables, in a bounded LRU cache. Readings are classified
+with the same care_bands tables as care_species.SpeciesRegistry.
+"""
+
+import argparse
+import bisect
+import functools
+import mmap
+import struct
+import sys
+
+import care_bands
+import care_rules
+
+MAGIC = b"PCARCATL"
+VERSION = 1
+HEADER = struct.Struct("<8sHHI")
+# watering_days, low/high temperature, low/high humidity, name/sunlight/care byte lengths
+ENTRY = struct.Struct("<HddBBHHH")
+
+DEFAULT_CACHE_SIZE = 1024
+
+
+def write_catalog(path: str, entries) -> int:
+    """Write species tuples in care_species.COLUMNS order to a catalog; return the count."""
+    rows = sorted(entries, key=lambda row: row[0])
+    for previous, row in zip(rows, rows[1:]):
+        if previous[0] == row[0]:
+            raise ValueError(f"Duplicate species id: {row[0]}")
+    ids = struct.pack(f"<{len(rows)}I", *(row[0] for row in rows))
+    ids += b"\0" * (-len(ids) % 8)
+    blobs = []
+    for species_id, name, watering_days, sunlight, care, low_t, high_t, low_h, high_h in rows:
+        texts = [text.encode("utf-8") for text in (name, sunlight, care)]
+        blobs.append(ENTRY.pack(watering_days, low_t, high_t, low_h, high_h, *map(len, texts)) + b"".join(texts))
+    offset = HEADER.size + len(ids) + 8 * (len(rows) + 1)
+    offsets = [offset]
+    for blob in blobs:
+        offset += len(blob)
+        offsets.append(offset)
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(rows)))
+        f.write(ids)
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        f.writelines(blobs)
+    return len(rows)
+
+
+class SpeciesCatalog:
+    """Read-only species lookups over a memory-mapped catalog file.
+
+    Offers the lookup methods of care_species.SpeciesRegistry, so either can
+    back the advisor.
+    """
+
+    def __init__(self, path: str, cache_size: int = DEFAULT_CACHE_SIZE):
+        if sys.byteorder != "little":
+            raise ValueError("Species catalogs are read through native views and need a little-endian host.")
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                raise ValueError(f"{path}: not a species catalog")
+            magic, version, _, self.count = HEADER.unpack(header)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path}: not a species catalog")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(self._map)
+        ids_size = 4 * self.count + (-4 * self.count % 8)
+        self._ids = view[HEADER.size:HEADER.size + 4 * self.count].cast("I")
+        offsets_start = HEADER.size + ids_size
+        self._offsets = view[offsets_start:offsets_start + 8 * (self.count + 1)].cast("Q")
+        self.entry = functools.lru_cache(maxsize=cache_size)(self._read_entry)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, species_id) -> bool:
+        return isinstance(species_id, int) and not isinstance(species_id, bool) \
+            and self._position(species_id) is not None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _position(self, species_id: int):
+        position = bisect.bisect_left(self._ids, species_id)
+        if position < self.count and self._ids[position] == species_id:
+            return position
+        return None
+
+    def _read_entry(self, species_id: int) -> tuple:
+        position = self._position(species_id)
+        if position is None:
+            return None
+        start = self._offsets[position]
+        watering_days, low_t, high_t, low_h, high_h, *lengths = ENTRY.unpack_from(self._map, start)
+        texts = []
+        start += ENTRY.size
+        for length in lengths:
+            texts.append(self._map[start:start + length].decode("utf-8"))
+            start += length
+        name, sunlight, care = texts
+        return (name, watering_days, sunlight, care, (low_t, high_t, low_h, high_h),
+                care_bands.temperature_table(low_t, high_t), care_bands.humidity_table(low_h, high_h))
+
+    def check(self, species_id) -> tuple:
+        """Return the decoded entry, raising the skeleton's plant type errors for an unknown id."""
+        if isinstance(species_id, bool) or not isinstance(species_id, int):
+            raise ValueError("Plant type must be an integer.")
+        entry = self.entry(species_id)
+        if entry is None:
+            raise ValueError("Invalid plant type")
+        return entry
+
+    def watering_days(self, species_id: int) -> int:
+        return self.check(species_id)[1]
+
+    def sunlight_requirement(self, species_id: int) -> str:
+        return self.check(species_id)[2]
+
+    def species_thresholds(self, species_id: int) -> tuple:
+        return self.check(species_id)[4]
+
+    def advise(self, species_id: int, season: int, temperature: float, humidity: int) -> str:
+        """Validate a reading and render its instructions with the species' values."""
+        _, watering_days, sunlight, care, _, temperature_bands, humidity_bands = self.check(species_id)
+        care_rules.validate_conditions(season, temperature, humidity)
+        return care_bands.render(
+            watering_days, sunlight, care, temperature_bands, humidity_bands, season, temperature, humidity,
+        )
+
+    def close(self):
+        if self._map.closed:
+            return
+        self.entry.cache_clear()
+        self._ids.release()
+        self._offsets.release()
+        self._map.close()
+
+
+def main(argv=None):
+    """Compile a species CSV (see care_species) into a catalog file."""
+    import care_species
+
+    parser = argparse.ArgumentParser(description="Compile a species CSV into an indexed catalog file.")
+    parser.add_argument("csv", help="species CSV file")
+    parser.add_argument("catalog", help="catalog file to write")
+    parser.add_argument("--no-builtins", action="store_true", help="leave out the four SRS plant types")
+    args = parser.parse_args(argv)
+
+    registry = care_species.SpeciesRegistry(builtins=not args.no_builtins)
+    registry.load(args.csv)
+    count = write_catalog(args.catalog, registry.entries())
+    print(f"Wrote {count} species to {args.catalog}")
+
+
+if __name__ == "__main__":
+    main()
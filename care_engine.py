@@ -0,0 +1,204 @@
+"""Declarative care rules compiled into a flat per-class instruction table.
+
+A rule maps conditions on plant type, season, temperature band and humidity
+band to one advice fragment:
+
+    Rule("Increase watering frequency", season=2)
+    Rule.from_dict({"when": {"plant_type": [1, 3], "temperature_band": 2}, "advice": "..."})
+
+A condition left out matches any value; a list matches any of its values.
+RuleEngine compiles a rule set once: every rule appends its fragment to the
+classes it matches, in rule order, and each class's full instructions are
+rendered up front. Evaluating a reading is then validation, two band searches
+and one index, whatever the number of rules. The engine records its compile
+time and can time its own evaluation (see timings()).
+"""
+
+import argparse
+import bisect
+import itertools
+import json
+import random
+import time
+
+import care_bands
+import care_rules
+
+CONDITIONS = ("plant_type", "season", "temperature_band", "humidity_band")
+
+_default = None
+
+
+class Rule:
+    """One advice fragment and the conditions under which it applies."""
+    __slots__ = ("advice",) + CONDITIONS
+
+    def __init__(self, advice: str, plant_type=None, season=None, temperature_band=None, humidity_band=None):
+        self.advice = advice
+        for name, value in zip(CONDITIONS, (plant_type, season, temperature_band, humidity_band)):
+            if value is not None:
+                value = frozenset([value] if isinstance(value, int) else value)
+            setattr(self, name, value)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Rule":
+        """Build a rule from {"when": {condition: value or list}, "advice": text}."""
+        when = data.get("when", {})
+        unknown = set(when).difference(CONDITIONS)
+        if unknown:
+            raise ValueError(f"Unknown rule conditions: {', '.join(sorted(unknown))}")
+        return cls(data["advice"], **when)
+
+
+DEFAULT_RULES = tuple(
+    [Rule(care, plant_type=index + 1) for index, care in enumerate(care_rules.PLANT_CARE)]
+    + [Rule(care, season=index + 1) for index, care in enumerate(care_rules.SEASON_CARE) if care is not None]
+    + [Rule(care, temperature_band=band) for band, care in enumerate(care_rules.TEMPERATURE_CARE) if care is not None]
+    + [Rule(advice, humidity_band=band) for band, (_, advice) in enumerate(care_rules.HUMIDITY_NEEDS)]
+)
+
+
+def load_rules(path: str) -> list[Rule]:
+    """Read a JSON list of rule dicts (see Rule.from_dict)."""
+    with open(path) as f:
+        return [Rule.from_dict(data) for data in json.load(f)]
+
+
+class RuleEngine:
+    """A rule set compiled against temperature and humidity band tables.
+
+    Band conditions are codes into the engine's tables, so a rule set written
+    for the SRS three bands needs its band rules revisited for wider tables.
+    """
+
+    def __init__(self, rules=DEFAULT_RULES, temperature_bands: care_bands.BandTable = None,
+                 humidity_bands: care_bands.BandTable = None):
+        start = time.perf_counter()
+        self.rules = tuple(rule if isinstance(rule, Rule) else Rule.from_dict(rule) for rule in rules)
+        self.temperature_bands = temperature_bands or care_bands.temperature_table()
+        self.humidity_bands = humidity_bands or care_bands.humidity_table()
+        # Codes per condition: plant types and seasons are 1-based, bands 0-based
+        self.domains = (
+            range(1, len(care_rules.PLANT_TYPES) + 1),
+            range(1, len(care_rules.SEASONS) + 1),
+            range(len(self.temperature_bands)),
+            range(len(self.humidity_bands)),
+        )
+        # Strides of class_index, so evaluation can inline it
+        hum_size = len(self.domains[3])
+        temp_stride = hum_size
+        season_stride = len(self.domains[2]) * temp_stride
+        type_stride = len(self.domains[1]) * season_stride
+        self.strides = (type_stride, season_stride, temp_stride, type_stride + season_stride)
+        self.fragments = self.compile_fragments()
+        self.table = tuple(
+            self.render(codes, fragments)
+            for codes, fragments in zip(itertools.product(*self.domains), self.fragments)
+        )
+        self.compile_seconds = time.perf_counter() - start
+
+    def class_index(self, plant_type: int, season: int, temp_band: int, hum_band: int) -> int:
+        """Return the table slot for a class; slots follow itertools.product over the domains."""
+        return (((plant_type - 1) * len(self.domains[1]) + season - 1) * len(self.domains[2])
+                + temp_band) * len(self.domains[3]) + hum_band
+
+    def compile_fragments(self) -> list[list[str]]:
+        """Return each class's advice fragments, in rule order."""
+        fragments = [[] for _ in itertools.product(*self.domains)]
+        for number, rule in enumerate(self.rules):
+            allowed = []
+            for name, domain in zip(CONDITIONS, self.domains):
+                values = getattr(rule, name)
+                if values is None:
+                    allowed.append(domain)
+                    continue
+                outside = values.difference(domain)
+                if outside:
+                    raise ValueError(f"Rule {number}: {name} {sorted(outside)} out of range")
+                allowed.append(sorted(values))
+            for codes in itertools.product(*allowed):
+                fragments[self.class_index(*codes)].append(rule.advice)
+        return fragments
+
+    def render(self, codes: tuple, fragments: list[str]) -> str:
+        plant_type, season, temp_band, hum_band = codes
+        return "\n".join([
+            f"Watering Schedule: Every "
+            f"{care_rules.season_adjusted_days(care_rules.watering_days(plant_type), season)} days",
+            f"Sunlight Requirement: {care_rules.sunlight_requirement(plant_type)}",
+            f"Temperature Status: {self.temperature_bands.labels[temp_band]}",
+            f"Humidity Level: {self.humidity_bands.labels[hum_band]}",
+            "Special Care Instructions:",
+            *fragments,
+        ])
+
+    def generate_care_instructions(self, plant_type: int, season: int, temperature: float, humidity: int) -> str:
+        """Rule-driven equivalent of skeleton.generate_care_instructions."""
+        care_rules.validate_reading(plant_type, season, temperature, humidity)
+        type_stride, season_stride, temp_stride, offset = self.strides
+        return self.table[
+            plant_type * type_stride + season * season_stride - offset
+            + bisect.bisect_right(self.temperature_bands.edges, temperature) * temp_stride
+            + bisect.bisect_right(self.humidity_bands.edges, humidity)
+        ]
+
+    def time_eval(self, number: int = 100000) -> float:
+        """Mean nanoseconds per generate_care_instructions call over a grid of valid readings."""
+        readings = list(itertools.product(
+            self.domains[0], self.domains[1], range(-10, 51, 5), range(0, 101, 10),
+        ))
+        readings = list(itertools.islice(itertools.cycle(readings), number))
+        evaluate = self.generate_care_instructions
+        start = time.perf_counter()
+        for reading in readings:
+            evaluate(*reading)
+        return (time.perf_counter() - start) / number * 1e9
+
+    def timings(self, number: int = 100000) -> dict:
+        """Report the rule and class counts, compile time and measured evaluation time."""
+        return {
+            "rules": len(self.rules),
+            "classes": len(self.table),
+            "compile_ms": self.compile_seconds * 1e3,
+            "eval_ns": self.time_eval(number),
+        }
+
+
+def default_engine() -> RuleEngine:
+    """Return the engine for the SRS rules, compiling it on first use."""
+    global _default
+    if _default is None:
+        _default = RuleEngine()
+    return _default
+
+
+def synthetic_rules(count: int, seed: int = 0) -> list[Rule]:
+    """Random extra rules, for measuring how the engine scales with rule count."""
+    rng = random.Random(seed)
+    rules = []
+    for number in range(count):
+        conditions = {}
+        for name, domain in zip(CONDITIONS, (range(1, 5), range(1, 5), range(3), range(3))):
+            if rng.random() < 0.5:
+                conditions[name] = rng.sample(domain, rng.randint(1, len(domain)))
+        rules.append(Rule(f"Synthetic advice {number}", **conditions))
+    return rules
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Report rule engine compile and evaluation timings.")
+    parser.add_argument("--rules", help="JSON rule file (default: the SRS rules)")
+    parser.add_argument("--extra-rules", type=int, nargs="*", default=[0, 100, 1000],
+                        help="synthetic rule counts to add to the rule set")
+    parser.add_argument("--number", type=int, default=100000, help="evaluations to time")
+    args = parser.parse_args(argv)
+
+    rules = load_rules(args.rules) if args.rules else list(DEFAULT_RULES)
+    print(f"{'rules':>7} {'classes':>8} {'compile ms':>11} {'eval ns':>9}")
+    for extra in args.extra_rules:
+        report = RuleEngine(rules + synthetic_rules(extra)).timings(args.number)
+        print(f"{report['rules']:>7} {report['classes']:>8} {report['compile_ms']:>11.2f} {report['eval_ns']:>9.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Incremental fleet state that re-evaluates plants only on band changes.
+
+Care instructions only change when a plant's type, season, temperature band
+or humidity band changes, i.e. when its care_table class changes. FleetState
+keeps each plant's current class and instructions; an update whose reading
+stays in the same class is a validation, a class computation and an integer
+compare, with no string work.
+"""
+
+import numpy as np
+
+import care_batch
+import care_rules
+import care_table
+
+UNSET = -1
+
+
+class FleetState:
+    """Current advice for plants with dense integer ids 0..size-1."""
+
+    def __init__(self, size: int, evaluate=care_table.generate_care_instructions):
+        self.evaluate = evaluate
+        self.classes = np.full(size, UNSET, dtype=np.int16)
+        self.instructions = [None] * size
+        self.evaluations = 0
+
+    def __len__(self):
+        return len(self.instructions)
+
+    def _check_id(self, plant_id: int):
+        if not isinstance(plant_id, int) or not 0 <= plant_id < len(self.instructions):
+            raise ValueError(f"Invalid plant id: {plant_id}")
+
+    def update(self, plant_id: int, plant_type: int, season: int, temperature: float, humidity: int) -> bool:
+        """Record a reading; return True when the plant's advice changed."""
+        self._check_id(plant_id)
+        care_rules.validate_reading(plant_type, season, temperature, humidity)
+        new_class = care_table.class_index(
+            plant_type, season, care_rules.temperature_band(temperature), care_rules.humidity_band(humidity)
+        )
+        if self.classes[plant_id] == new_class:
+            return False
+        self.classes[plant_id] = new_class
+        self.instructions[plant_id] = self.evaluate(plant_type, season, temperature, humidity)
+        self.evaluations += 1
+        return True
+
+    def update_batch(self, plant_id, plant_type, season, temperature, humidity) -> np.ndarray:
+        """Record many readings at once; return the ids whose advice changed.
+
+        When an id appears more than once, its last reading wins.
+        """
+        plant_type, season, temperature, humidity = care_batch.validate_batch(
+            plant_type, season, temperature, humidity
+        )
+        plant_id = np.asarray(plant_id).ravel()
+        if plant_id.size != plant_type.size:
+            raise ValueError("Input arrays must have the same length.")
+        if plant_id.size and (plant_id.min() < 0 or plant_id.max() >= len(self.instructions)):
+            raise ValueError("Invalid plant id")
+
+        # Keep only the last reading per plant id
+        _, last = np.unique(plant_id[::-1], return_index=True)
+        rows = plant_id.size - 1 - last
+        plant_id = plant_id[rows]
+
+        new_classes = (
+            ((plant_type[rows].astype(np.int16) - 1) * 4 + (season[rows] - 1)) * 3
+            + care_batch.temperature_bands(temperature[rows])
+        ) * 3 + care_batch.humidity_bands(humidity[rows])
+        changed = new_classes != self.classes[plant_id]
+        self.classes[plant_id[changed]] = new_classes[changed]
+        changed_rows = rows[changed]
+        for pid, pt, s, t, h in zip(
+            plant_id[changed].tolist(),
+            plant_type[changed_rows].tolist(),
+            season[changed_rows].tolist(),
+            temperature[changed_rows].tolist(),
+            humidity[changed_rows].tolist(),
+        ):
+            self.instructions[pid] = self.evaluate(pt, s, t, h)
+        self.evaluations += len(changed_rows)
+        return plant_id[changed]
+
+    def get(self, plant_id: int) -> str:
+        """Return the current instructions for a plant, or None before its first reading."""
+        self._check_id(plant_id)
+        return self.instructions[plant_id]
@@ -0,0 +1,143 @@
+"""Fixed-width binary sensor history with memory-mapped, zero-copy reads.
+
+File layout (little-endian):
+
+    header   magic b"PCARHIST", uint16 version, uint16 record size,
+             uint32 block size, uint64 record count, uint64 index offset
+    records  RECORD_DTYPE rows, back to back
+    index    INDEX_DTYPE rows, one per block of block_size records:
+             first timestamp and first record number of the block
+
+Records are READING_DTYPE readings prefixed by a plant id and a timestamp,
+so a reader can hand numpy views straight to care_records.evaluate_array.
+Writers should fill the temperature column with care_records.to_tenths_array,
+which keeps each stored value in the band of the original reading.
+Records are expected in timestamp order; the index lets a reader find a time
+range without scanning.
+"""
+
+import struct
+
+import numpy as np
+
+import care_records
+
+MAGIC = b"PCARHIST"
+VERSION = 1
+HEADER = struct.Struct("<8sHHIQQ")
+
+RECORD_DTYPE = np.dtype([
+    ("timestamp", "<i8"),
+    ("plant_id", "<u4"),
+    ("plant_type", "u1"),
+    ("season", "u1"),
+    ("temperature", "<i2"),
+    ("humidity", "u1"),
+])
+
+INDEX_DTYPE = np.dtype([("timestamp", "<i8"), ("record", "<u8")])
+
+DEFAULT_BLOCK_SIZE = 65536
+
+READING_FIELDS = care_records.READING_DTYPE.names
+
+
+class HistoryWriter:
+    """Append records to a history file; the index is written on close."""
+
+    def __init__(self, path: str, block_size: int = DEFAULT_BLOCK_SIZE):
+        if block_size < 1:
+            raise ValueError("Block size must be positive.")
+        self.block_size = block_size
+        self.count = 0
+        self.index = []
+        self.last_timestamp = None
+        self.file = open(path, "wb")
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, block_size, 0, 0))
+
+    def write(self, records: np.ndarray):
+        """Append a RECORD_DTYPE array, which must continue timestamp order."""
+        records = np.asarray(records, dtype=RECORD_DTYPE)
+        if not records.size:
+            return
+        timestamps = records["timestamp"]
+        if (self.last_timestamp is not None and timestamps[0] < self.last_timestamp) or (
+                np.diff(timestamps) < 0).any():
+            raise ValueError("Records must be in timestamp order.")
+        first = -self.count % self.block_size
+        for row in range(first, records.size, self.block_size):
+            self.index.append((int(timestamps[row]), self.count + row))
+        self.file.write(records.tobytes())
+        self.count += records.size
+        self.last_timestamp = int(timestamps[-1])
+
+    def close(self):
+        if self.file.closed:
+            return
+        index_offset = self.file.tell()
+        self.file.write(np.array(self.index, dtype=INDEX_DTYPE).tobytes())
+        self.file.seek(0)
+        self.file.write(HEADER.pack(MAGIC, VERSION, RECORD_DTYPE.itemsize, self.block_size, self.count, index_offset))
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class HistoryReader:
+    """Memory-mapped view of a history file."""
+
+    def __init__(self, path: str):
+        with open(path, "rb") as f:
+            header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            raise ValueError("Not a plant care history file.")
+        magic, version, record_size, block_size, count, index_offset = HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ValueError("Not a plant care history file.")
+        if version != VERSION or record_size != RECORD_DTYPE.itemsize:
+            raise ValueError(f"Unsupported history file version: {version}")
+        self.block_size = block_size
+        if count:
+            self.records = np.memmap(path, dtype=RECORD_DTYPE, mode="r", offset=HEADER.size, shape=(count,))
+            index_count = (count + block_size - 1) // block_size
+            self.index = np.memmap(path, dtype=INDEX_DTYPE, mode="r", offset=index_offset, shape=(index_count,))
+        else:
+            self.records = np.empty(0, dtype=RECORD_DTYPE)
+            self.index = np.empty(0, dtype=INDEX_DTYPE)
+
+    def __len__(self):
+        return len(self.records)
+
+    def readings(self, records: np.ndarray = None) -> np.ndarray:
+        """Return a zero-copy READING_DTYPE-shaped view over records (default: all)."""
+        records = self.records if records is None else records
+        return records[list(READING_FIELDS)]
+
+    def between(self, start: int, end: int) -> np.ndarray:
+        """Return the records with start <= timestamp < end as a view."""
+        # Narrow to the candidate blocks with the index, then search within them
+        first_block = max(int(np.searchsorted(self.index["timestamp"], start, side="left")) - 1, 0)
+        last_block = int(np.searchsorted(self.index["timestamp"], end, side="left"))
+        lo = int(self.index["record"][first_block]) if len(self.index) else 0
+        hi = int(self.index["record"][last_block]) if last_block < len(self.index) else len(self.records)
+        window = self.records["timestamp"][lo:hi]
+        return self.records[lo + int(np.searchsorted(window, start)):lo + int(np.searchsorted(window, end))]
+
+    def evaluate(self, records: np.ndarray = None) -> np.ndarray:
+        """Evaluate records (default: all) into an ADVICE_DTYPE array."""
+        return care_records.evaluate_array(self.readings(records))
+
+    def close(self):
+        """Drop the mappings; they are released once no views remain."""
+        self.records = np.empty(0, dtype=RECORD_DTYPE)
+        self.index = np.empty(0, dtype=INDEX_DTYPE)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,196 @@
+"""Optional call counters and latency histograms for the advisory functions.
+
+instrument() swaps the functions in a module (skeleton by default) for
+wrappers that record call counts, ValueError counts by message and latency
+histograms; uninstrument() puts the original functions back, so the disabled
+state costs nothing. Because skeleton's functions call each other through
+module globals, nested helper calls are recorded too.
+
+Run the console through this module to instrument it and dump a snapshot on
+exit (to stderr, or to the file named by PLANT_CARE_INSTRUMENT_DUMP):
+
+    python care_instrument.py [--batch [FILE]]
+
+Other programs opt in by calling enable_from_env() at startup; it instruments
+only when PLANT_CARE_INSTRUMENT is set to something other than 0.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+import skeleton
+
+INSTRUMENTED_FUNCTIONS = (
+    "calculate_watering_schedule",
+    "adjust_for_season",
+    "check_temperature",
+    "determine_humidity_needs",
+    "get_sunlight_requirement",
+    "generate_care_instructions",
+)
+
+SUB_BUCKET_BITS = 5
+
+
+class LatencyHistogram:
+    """Log-linear (HDR-style) histogram of nanosecond latencies.
+
+    Values keep their top SUB_BUCKET_BITS significant bits, which bounds the
+    relative error of every recorded value to about 6% at any magnitude.
+    """
+
+    __slots__ = ("counts", "total", "max")
+
+    def __init__(self):
+        self.counts = Counter()
+        self.total = 0
+        self.max = 0
+
+    def record(self, value: int):
+        shift = max(0, value.bit_length() - SUB_BUCKET_BITS)
+        self.counts[(value >> shift) << shift] += 1
+        self.total += 1
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, pct: float) -> int:
+        """Return the bucket lower bound at the given percentile (0-100)."""
+        if not self.total:
+            return 0
+        threshold = self.total * pct / 100
+        seen = 0
+        for value in sorted(self.counts):
+            seen += self.counts[value]
+            if seen >= threshold:
+                return value
+        return self.max
+
+    def summary(self) -> dict:
+        return {
+            "count": self.total,
+            "p50_ns": self.percentile(50),
+            "p90_ns": self.percentile(90),
+            "p99_ns": self.percentile(99),
+            "p999_ns": self.percentile(99.9),
+            "max_ns": self.max,
+        }
+
+
+class FunctionStats:
+    """Counters for one instrumented function."""
+
+    __slots__ = ("calls", "errors", "latency")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = Counter()
+        self.latency = LatencyHistogram()
+
+    def summary(self) -> dict:
+        return {"calls": self.calls, "errors": dict(self.errors), "latency": self.latency.summary()}
+
+
+_lock = threading.Lock()
+_stats = {}
+_originals = {}
+_module = None
+
+
+def _wrap(name: str, func):
+    stats = _stats.setdefault(name, FunctionStats())
+    clock = time.perf_counter_ns
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        start = clock()
+        try:
+            return func(*args, **kwargs)
+        except ValueError as e:
+            with _lock:
+                stats.errors[str(e)] += 1
+            raise
+        finally:
+            elapsed = clock() - start
+            with _lock:
+                stats.calls += 1
+                stats.latency.record(elapsed)
+
+    wrapper.__wrapped__ = func
+    return wrapper
+
+
+def instrument(module=skeleton, names=INSTRUMENTED_FUNCTIONS):
+    """Replace the named module functions with recording wrappers."""
+    global _module
+    if _module is not None:
+        return
+    _module = module
+    for name in names:
+        _originals[name] = getattr(module, name)
+        setattr(module, name, _wrap(name, _originals[name]))
+
+
+def uninstrument():
+    """Restore the original functions; recorded stats are kept."""
+    global _module
+    if _module is None:
+        return
+    for name, func in _originals.items():
+        setattr(_module, name, func)
+    _originals.clear()
+    _module = None
+
+
+def is_instrumented() -> bool:
+    return _module is not None
+
+
+def reset():
+    """Discard all recorded stats."""
+    with _lock:
+        for stats in _stats.values():
+            stats.__init__()
+
+
+def snapshot() -> dict:
+    """Return the current stats for every instrumented function."""
+    with _lock:
+        return {name: stats.summary() for name, stats in _stats.items()}
+
+
+def dump(path: str = None):
+    """Write a JSON snapshot to path, or to stderr when no path is given."""
+    data = json.dumps(snapshot(), indent=2)
+    if path:
+        with open(path, "w") as f:
+            f.write(data)
+    else:
+        print(data, file=sys.stderr)
+
+
+def enable_from_env():
+    """Instrument and register an exit dump when PLANT_CARE_INSTRUMENT is set."""
+    if os.environ.get("PLANT_CARE_INSTRUMENT") not in (None, "", "0"):
+        instrument()
+        atexit.register(dump, os.environ.get("PLANT_CARE_INSTRUMENT_DUMP"))
+
+
+def main(argv=None):
+    """Run skeleton's console, or its --batch mode, with instrumentation on unless PLANT_CARE_INSTRUMENT=0."""
+    argv = sys.argv[1:] if argv is None else argv
+    os.environ.setdefault("PLANT_CARE_INSTRUMENT", "1")
+    enable_from_env()
+    if argv[:1] == ["--batch"]:
+        skeleton.batch_main(argv[1:])
+    else:
+        skeleton.main()
+
+
+if __name__ == "__main__":
+    main()
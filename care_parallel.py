@@ -0,0 +1,67 @@
+"""Multi-process sharded batch advisor for large plant fleets.
+
+Readings are ordered by plant id, cut into shards of ``chunk_size`` rows and
+shipped to worker processes as packed structured-array bytes. Each worker runs
+the vectorized batch evaluation and returns packed result bytes, which are
+scattered back into input order.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import care_batch
+import care_records
+
+SHARD_DTYPE = np.dtype([
+    ("plant_type", np.uint8),
+    ("season", np.uint8),
+    ("temperature", np.float64),
+    ("humidity", np.uint8),
+])
+
+RESULT_DTYPE = care_records.ADVICE_DTYPE
+
+DEFAULT_CHUNK_SIZE = 65536
+
+
+def _evaluate_shard(payload: bytes) -> bytes:
+    """Worker: evaluate one packed shard and return packed results."""
+    shard = np.frombuffer(payload, dtype=SHARD_DTYPE)
+    columns = care_batch.evaluate_batch(
+        shard["plant_type"], shard["season"], shard["temperature"], shard["humidity"]
+    )
+    results = np.empty(len(shard), dtype=RESULT_DTYPE)
+    results["plant_type"] = shard["plant_type"]
+    results["season"] = shard["season"]
+    for name in care_batch.FIELDS:
+        results[name] = columns[name]
+    return results.tobytes()
+
+
+def evaluate_parallel(plant_id, plant_type, season, temperature, humidity,
+                      workers: int = None, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict[str, np.ndarray]:
+    """Evaluate a fleet across a process pool; results match evaluate_batch in input order."""
+    if chunk_size < 1:
+        raise ValueError("Chunk size must be positive.")
+    plant_type, season, temperature, humidity = care_batch.validate_batch(plant_type, season, temperature, humidity)
+    plant_id = np.asarray(plant_id).ravel()
+    if plant_id.size != plant_type.size:
+        raise ValueError("Input arrays must have the same length.")
+
+    order = np.argsort(plant_id, kind="stable")
+    packed = np.empty(order.size, dtype=SHARD_DTYPE)
+    packed["plant_type"] = plant_type[order]
+    packed["season"] = season[order]
+    packed["temperature"] = temperature[order]
+    packed["humidity"] = humidity[order]
+
+    bounds = range(0, order.size, chunk_size)
+    payloads = (packed[start:start + chunk_size].tobytes() for start in bounds)
+    results = np.empty(order.size, dtype=RESULT_DTYPE)
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+        for start, payload in zip(bounds, pool.map(_evaluate_shard, payloads)):
+            shard = np.frombuffer(payload, dtype=RESULT_DTYPE)
+            results[order[start:start + shard.size]] = shard
+    return {name: results[name] for name in care_batch.FIELDS}
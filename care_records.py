@@ -0,0 +1,225 @@
+"""Compact record types for readings and advice.
+
+PlantReading and Advice use __slots__ for single records; READING_DTYPE and
+ADVICE_DTYPE are the matching packed NumPy layouts (5 bytes per reading,
+7 bytes per advice) for holding whole fleets in memory. Temperatures are
+stored as int16 tenths of a degree Celsius, quantized by to_tenths so that a
+stored value stays in the temperature band of the reading it came from.
+Advice keeps only codes and renders its instruction text on demand.
+"""
+
+from enum import IntEnum
+
+import numpy as np
+
+import care_batch
+import care_rules
+
+READING_DTYPE = np.dtype([
+    ("plant_type", np.uint8),
+    ("season", np.uint8),
+    ("temperature", np.int16),
+    ("humidity", np.uint8),
+])
+
+ADVICE_DTYPE = np.dtype([
+    ("plant_type", np.uint8),
+    ("season", np.uint8),
+    ("watering_days", np.int16),
+    ("temperature_status", np.uint8),
+    ("humidity_level", np.uint8),
+    ("sunlight_requirement", np.uint8),
+])
+
+
+# Tenths range of each temperature band: (lowest, highest) stored value
+LOW_TENTHS = round(care_rules.LOW_TEMPERATURE * 10)
+HIGH_TENTHS = round(care_rules.HIGH_TEMPERATURE * 10)
+BAND_TENTHS = (
+    (round(care_rules.MIN_TEMPERATURE * 10), LOW_TENTHS - 1),
+    (LOW_TENTHS, HIGH_TENTHS),
+    (HIGH_TENTHS + 1, round(care_rules.MAX_TEMPERATURE * 10)),
+)
+
+
+def to_tenths(temperature: float) -> int:
+    """Round a temperature to tenths without moving it into another band.
+
+    Plain rounding would store 9.96 as 10.0 (optimal) and 30.04 as 30.0
+    (optimal), although both readings are outside the optimal band; they are
+    stored as 9.9 and 30.1 instead.
+    """
+    low, high = BAND_TENTHS[care_rules.temperature_band(temperature)]
+    return min(max(round(temperature * 10), low), high)
+
+
+def to_tenths_array(temperature) -> np.ndarray:
+    """Vectorized to_tenths, returning int16."""
+    temperature = np.asarray(temperature, dtype=np.float64)
+    bands = care_batch.temperature_bands(temperature)
+    low = np.array([band[0] for band in BAND_TENTHS])[bands]
+    high = np.array([band[1] for band in BAND_TENTHS])[bands]
+    return np.clip(np.rint(temperature * 10), low, high).astype(np.int16)
+
+
+class PlantType(IntEnum):
+    SUCCULENT = 1
+    TROPICAL = 2
+    FLOWERING = 3
+    HERB = 4
+
+
+class Season(IntEnum):
+    SPRING = 1
+    SUMMER = 2
+    FALL = 3
+    WINTER = 4
+
+
+class TemperatureStatus(IntEnum):
+    LOW = care_rules.BAND_LOW
+    OPTIMAL = care_rules.BAND_MID
+    HIGH = care_rules.BAND_HIGH
+
+
+class HumidityLevel(IntEnum):
+    LOW = care_rules.BAND_LOW
+    MEDIUM = care_rules.BAND_MID
+    HIGH = care_rules.BAND_HIGH
+
+
+class SunlightRequirement(IntEnum):
+    FULL_SUN_TO_PARTIAL_SHADE = 0
+    BRIGHT_INDIRECT_LIGHT = 1
+    FULL_SUN = 2
+    DIRECT_SUNLIGHT_6_HOURS = 3
+
+
+class PlantReading:
+    """One sensor reading; temperature is kept in tenths of a degree."""
+
+    __slots__ = ("plant_type", "season", "temperature_tenths", "humidity")
+
+    def __init__(self, plant_type: int, season: int, temperature: float, humidity: int):
+        care_rules.validate_reading(plant_type, season, temperature, humidity)
+        self.plant_type = plant_type
+        self.season = season
+        self.temperature_tenths = to_tenths(temperature)
+        self.humidity = humidity
+
+    @property
+    def temperature(self) -> float:
+        return self.temperature_tenths / 10
+
+    def __repr__(self):
+        return (f"PlantReading(plant_type={self.plant_type}, season={self.season}, "
+                f"temperature={self.temperature}, humidity={self.humidity})")
+
+    def evaluate(self) -> "Advice":
+        """Compute the advice codes for this reading."""
+        return Advice(
+            PlantType(self.plant_type),
+            self.season,
+            care_rules.season_adjusted_days(care_rules.watering_days(self.plant_type), self.season),
+            TemperatureStatus(care_rules.temperature_band(self.temperature)),
+            HumidityLevel(care_rules.humidity_band(self.humidity)),
+            SunlightRequirement(self.plant_type - 1),
+        )
+
+
+class Advice:
+    """Advice for one reading as integer codes; text is rendered only on request."""
+
+    __slots__ = ("plant_type", "season", "watering_days", "temperature_status", "humidity_level",
+                 "sunlight_requirement")
+
+    def __init__(self, plant_type: PlantType, season: int, watering_days: int, temperature_status: TemperatureStatus,
+                 humidity_level: HumidityLevel, sunlight_requirement: SunlightRequirement):
+        self.plant_type = plant_type
+        self.season = season
+        self.watering_days = watering_days
+        self.temperature_status = temperature_status
+        self.humidity_level = humidity_level
+        self.sunlight_requirement = sunlight_requirement
+
+    def __repr__(self):
+        return (f"Advice(plant_type={self.plant_type.name}, season={self.season}, watering_days={self.watering_days}, "
+                f"temperature_status={self.temperature_status.name}, humidity_level={self.humidity_level.name}, sunlight_requirement={self.sunlight_requirement.name})")
+
+    def __eq__(self, other):
+        if not isinstance(other, Advice):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+    def __str__(self):
+        return self.render()
+
+    @property
+    def temperature_text(self) -> str:
+        return care_rules.TEMPERATURE_STATUS[self.temperature_status]
+
+    @property
+    def humidity_text(self) -> tuple[str, str]:
+        return care_rules.HUMIDITY_NEEDS[self.humidity_level]
+
+    @property
+    def sunlight_text(self) -> str:
+        return care_rules.SUNLIGHT_REQUIREMENTS[self.sunlight_requirement]
+
+    @property
+    def care_text(self) -> str:
+        return care_rules.PLANT_CARE[self.plant_type - 1]
+
+    def render(self) -> str:
+        """Format the full care instructions from the held codes, as generate_care_instructions does."""
+        return care_rules.render_advice(
+            self.watering_days, self.sunlight_text, self.care_text, self.season,
+            self.temperature_status, self.humidity_level,
+        )
+
+
+def generate_advice(plant_type: int, season: int, temperature: float, humidity: int) -> Advice:
+    """Validate a reading once and return its advice codes without formatting any text."""
+    care_rules.validate_reading(plant_type, season, temperature, humidity)
+    return Advice(
+        PlantType(plant_type),
+        season,
+        care_rules.season_adjusted_days(care_rules.watering_days(plant_type), season),
+        TemperatureStatus(care_rules.temperature_band(temperature)),
+        HumidityLevel(care_rules.humidity_band(humidity)),
+        SunlightRequirement(plant_type - 1),
+    )
+
+
+def to_array(readings) -> np.ndarray:
+    """Pack an iterable of PlantReading objects into a READING_DTYPE array."""
+    return np.array(
+        [(r.plant_type, r.season, r.temperature_tenths, r.humidity) for r in readings],
+        dtype=READING_DTYPE,
+    )
+
+
+def reading_at(array: np.ndarray, index: int) -> PlantReading:
+    """Unpack one row of a READING_DTYPE array."""
+    plant_type, season, tenths, humidity = array[index].tolist()
+    return PlantReading(plant_type, season, tenths / 10, humidity)
+
+
+def evaluate_array(array: np.ndarray) -> np.ndarray:
+    """Evaluate a READING_DTYPE array into an ADVICE_DTYPE array."""
+    columns = care_batch.evaluate_batch(
+        array["plant_type"], array["season"], array["temperature"] / 10, array["humidity"]
+    )
+    advice = np.empty(len(array), dtype=ADVICE_DTYPE)
+    advice["plant_type"] = array["plant_type"]
+    advice["season"] = array["season"]
+    for name in care_batch.FIELDS:
+        advice[name] = columns[name]
+    return advice
+
+
+def advice_at(array: np.ndarray, index: int) -> Advice:
+    """Unpack one row of an ADVICE_DTYPE array."""
+    plant_type, season, days, temp_status, hum_level, sunlight = array[index].tolist()
+    return Advice(PlantType(plant_type), season, days, TemperatureStatus(temp_status), HumidityLevel(hum_level),
+                  SunlightRequirement(sunlight))
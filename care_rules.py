@@ -0,0 +1,212 @@
+"""Plant care rules from the SRS, expressed as lookup tables.
+
+The conditional functions in skeleton.py are the reference implementation of
+these rules. The tables here carry the same values so that bulk evaluation
+paths can index them instead of branching per plant.
+"""
+
+# Input domains
+PLANT_TYPES = ("Succulent", "Tropical", "Flowering", "Herb")
+SEASONS = ("Spring", "Summer", "Fall", "Winter")
+MIN_TEMPERATURE = -10.0
+MAX_TEMPERATURE = 50.0
+MIN_HUMIDITY = 0
+MAX_HUMIDITY = 100
+
+# Band boundaries used by check_temperature and determine_humidity_needs
+LOW_TEMPERATURE = 10.0
+HIGH_TEMPERATURE = 30.0
+LOW_HUMIDITY = 30
+HIGH_HUMIDITY = 60
+
+# Band codes: 0 = low, 1 = optimal/medium, 2 = high
+BAND_LOW = 0
+BAND_MID = 1
+BAND_HIGH = 2
+
+# Advice fields, in the order generate_care_instructions reports them
+FIELDS = ("watering_days", "temperature_status", "humidity_level", "sunlight_requirement")
+
+# Per plant type (index = plant_type - 1)
+WATERING_DAYS = (14, 3, 2, 1)
+SUNLIGHT_REQUIREMENTS = (
+    "Full sun to partial shade",
+    "Bright indirect light",
+    "Full sun",
+    "At least 6 hours of direct sunlight",
+)
+PLANT_CARE = (
+    "Avoid overwatering",
+    "Maintain high humidity",
+    "Remove dead flowers regularly",
+    "Harvest regularly to promote growth",
+)
+
+# Per season (index = season - 1); None means no seasonal tip
+SEASON_CARE = (None, "Increase watering frequency", None, "Reduce watering frequency")
+
+# Per temperature band
+TEMPERATURE_STATUS = (
+    "Temperature too low - Risk of cold damage",
+    "Temperature optimal for plant growth",
+    "Temperature too high - Risk of heat stress",
+)
+TEMPERATURE_CARE = (
+    "Protect from cold and reduce watering",
+    None,
+    "Provide shade and increase watering",
+)
+
+# Per humidity band: (level, advice)
+HUMIDITY_NEEDS = (
+    ("Low", "Increase humidity with misting"),
+    ("Medium", "Humidity is optimal"),
+    ("High", "Monitor for fungal growth"),
+)
+
+
+def watering_days(plant_type: int) -> int:
+    """Unchecked calculate_watering_schedule."""
+    return WATERING_DAYS[plant_type - 1]
+
+
+def season_adjusted_days(days: int, season: int) -> int:
+    """Unchecked adjust_for_season."""
+    if season == 2:
+        return max(1, days - 1)
+    elif season == 4:
+        return days + 1
+    else:
+        return days
+
+
+def temperature_band(temperature: float) -> int:
+    """Return the band code for a temperature without validation."""
+    if temperature > HIGH_TEMPERATURE:
+        return BAND_HIGH
+    elif temperature < LOW_TEMPERATURE:
+        return BAND_LOW
+    else:
+        return BAND_MID
+
+
+def humidity_band(humidity: int) -> int:
+    """Return the band code for a humidity percentage without validation."""
+    if humidity < LOW_HUMIDITY:
+        return BAND_LOW
+    elif humidity > HIGH_HUMIDITY:
+        return BAND_HIGH
+    else:
+        return BAND_MID
+
+
+def temperature_status(temperature: float) -> str:
+    """Unchecked check_temperature."""
+    return TEMPERATURE_STATUS[temperature_band(temperature)]
+
+
+def humidity_needs(humidity: int) -> tuple[str, str]:
+    """Unchecked determine_humidity_needs."""
+    return HUMIDITY_NEEDS[humidity_band(humidity)]
+
+
+def sunlight_requirement(plant_type: int) -> str:
+    """Unchecked get_sunlight_requirement."""
+    return SUNLIGHT_REQUIREMENTS[plant_type - 1]
+
+
+def format_instructions(days: int, sunlight: str, plant_care: str, season: int, temperature_status: str,
+                        temperature_care, humidity_level: str, humidity_advice: str) -> str:
+    """Lay out care instructions from their texts; temperature_care may be None."""
+    instructions = [
+        f"Watering Schedule: Every {days} days",
+        f"Sunlight Requirement: {sunlight}",
+        f"Temperature Status: {temperature_status}",
+        f"Humidity Level: {humidity_level}",
+        "Special Care Instructions:",
+        plant_care,
+    ]
+    if SEASON_CARE[season - 1] is not None:
+        instructions.append(SEASON_CARE[season - 1])
+    if temperature_care is not None:
+        instructions.append(temperature_care)
+    instructions.append(humidity_advice)
+    return "\n".join(instructions)
+
+
+def render_advice(days: int, sunlight: str, plant_care: str, season: int, temp_band: int, hum_band: int) -> str:
+    """Format care instructions from already-resolved plant values and band codes."""
+    level, advice = HUMIDITY_NEEDS[hum_band]
+    return format_instructions(days, sunlight, plant_care, season, TEMPERATURE_STATUS[temp_band],
+                               TEMPERATURE_CARE[temp_band], level, advice)
+
+
+def render_instructions(plant_type: int, season: int, temp_band: int, hum_band: int) -> str:
+    """Format care instructions the way generate_care_instructions does."""
+    return render_advice(
+        season_adjusted_days(watering_days(plant_type), season),
+        sunlight_requirement(plant_type),
+        PLANT_CARE[plant_type - 1],
+        season, temp_band, hum_band,
+    )
+
+
+def validate_reading(plant_type: int, season: int, temperature: float, humidity: int) -> None:
+    """Validate one reading with the checks and messages of generate_care_instructions.
+
+    Booleans are rejected although bool is an int subclass, as the exception suite requires.
+    """
+    if isinstance(plant_type, bool) or not isinstance(plant_type, int):
+        raise ValueError("Plant type must be an integer.")
+    if not 1 <= plant_type <= 4:
+        raise ValueError("Invalid plant type")
+    validate_conditions(season, temperature, humidity)
+
+
+def validate_conditions(season: int, temperature: float, humidity: int) -> None:
+    """Validate the season and sensor values of a reading."""
+    if isinstance(season, bool) or not isinstance(season, int):
+        raise ValueError("Season must be an integer.")
+    if not 1 <= season <= 4:
+        raise ValueError("Invalid season")
+    if isinstance(temperature, bool) or not isinstance(temperature, (int, float)):
+        raise ValueError("Temperature must be a number.")
+    if not MIN_TEMPERATURE <= temperature <= MAX_TEMPERATURE:
+        raise ValueError("Invalid temperature")
+    if isinstance(humidity, bool) or not isinstance(humidity, int):
+        raise ValueError("Humidity must be an integer.")
+    if not MIN_HUMIDITY <= humidity <= MAX_HUMIDITY:
+        raise ValueError("Invalid humidity")
+
+
+def advise(plant_type: int, season: int, temperature: float, humidity: int) -> str:
+    """Validate a reading once, then build its instructions with the unchecked helpers."""
+    validate_reading(plant_type, season, temperature, humidity)
+    return render_instructions(plant_type, season, temperature_band(temperature), humidity_band(humidity))
+
+
+def check_fields(fields) -> frozenset:
+    """Normalize a field selection; None selects every field."""
+    if fields is None:
+        return frozenset(FIELDS)
+    selected = frozenset(fields)
+    unknown = selected.difference(FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    return selected
+
+
+def evaluate_fields(plant_type: int, season: int, temperature: float, humidity: int, fields=None) -> dict:
+    """Validate a reading and compute only the selected advice fields as codes."""
+    selected = check_fields(fields)
+    validate_reading(plant_type, season, temperature, humidity)
+    result = {}
+    if "watering_days" in selected:
+        result["watering_days"] = season_adjusted_days(watering_days(plant_type), season)
+    if "temperature_status" in selected:
+        result["temperature_status"] = temperature_band(temperature)
+    if "humidity_level" in selected:
+        result["humidity_level"] = humidity_band(humidity)
+    if "sunlight_requirement" in selected:
+        result["sunlight_requirement"] = plant_type - 1
+    return result
@@ -0,0 +1,129 @@
+"""Min-heap scheduler tracking when each plant is next due for watering.
+
+Intervals come from the watering schedule and seasonal adjustment rules.
+Rescheduling (a new plant type or season) pushes a fresh heap entry and
+invalidates the old one lazily, so it costs O(log n); the heap is compacted
+when stale entries outnumber live ones. pop_due(now) returns every plant due
+at or before now in one call without scanning the fleet.
+"""
+
+import heapq
+import itertools
+
+import care_rules
+
+SECONDS_PER_DAY = 86400
+
+
+def watering_interval(plant_type: int, season: int) -> int:
+    """Return the seasonally adjusted watering interval in days."""
+    if not isinstance(plant_type, int):
+        raise ValueError("Plant type must be an integer.")
+    if not 1 <= plant_type <= 4:
+        raise ValueError("Invalid plant type. Must be between 1 and 4.")
+    if not isinstance(season, int):
+        raise ValueError("Season must be an integer.")
+    if not 1 <= season <= 4:
+        raise ValueError("Invalid season. Must be between 1 and 4.")
+    return care_rules.season_adjusted_days(care_rules.watering_days(plant_type), season)
+
+
+class WateringScheduler:
+    """Next-watering times for a fleet, ordered in a min-heap."""
+
+    def __init__(self, seconds_per_day: float = SECONDS_PER_DAY):
+        self.seconds_per_day = seconds_per_day
+        self._heap = []
+        self._tokens = itertools.count()
+        # plant_id -> [plant_type, season, last_watered, due, token]; heap entries
+        # are (due, token, plant_id) and are stale once the plant's token moves on
+        self._plants = {}
+
+    def __len__(self):
+        return len(self._plants)
+
+    def __contains__(self, plant_id):
+        return plant_id in self._plants
+
+    def _push(self, plant_id, state):
+        state[3] = state[2] + watering_interval(state[0], state[1]) * self.seconds_per_day
+        state[4] = next(self._tokens)
+        heapq.heappush(self._heap, (state[3], state[4], plant_id))
+        if len(self._heap) > 2 * len(self._plants) + 64:
+            self._compact()
+
+    def _compact(self):
+        """Drop stale heap entries."""
+        self._heap = [(state[3], state[4], plant_id) for plant_id, state in self._plants.items()]
+        heapq.heapify(self._heap)
+
+    def add(self, plant_id, plant_type: int, season: int, last_watered: float):
+        """Start tracking a plant last watered at the given timestamp."""
+        watering_interval(plant_type, season)
+        state = [plant_type, season, last_watered, None, None]
+        self._plants[plant_id] = state
+        self._push(plant_id, state)
+
+    def remove(self, plant_id):
+        """Stop tracking a plant; its heap entry is discarded lazily."""
+        del self._plants[plant_id]
+
+    def reschedule(self, plant_id, plant_type: int = None, season: int = None):
+        """Recompute a plant's due time after its type or season changed."""
+        state = self._plants[plant_id]
+        plant_type = state[0] if plant_type is None else plant_type
+        season = state[1] if season is None else season
+        watering_interval(plant_type, season)
+        state[0] = plant_type
+        state[1] = season
+        self._push(plant_id, state)
+
+    def set_season(self, season: int):
+        """Move every plant to a new season and rebuild the heap in O(n)."""
+        watering_interval(1, season)
+        for state in self._plants.values():
+            state[1] = season
+            state[3] = state[2] + watering_interval(state[0], season) * self.seconds_per_day
+        self._compact()
+
+    def watered(self, plant_id, now: float):
+        """Record a watering and schedule the next one."""
+        state = self._plants[plant_id]
+        state[2] = now
+        self._push(plant_id, state)
+
+    def next_due(self, plant_id) -> float:
+        return self._plants[plant_id][3]
+
+    def peek(self):
+        """Return (due, plant_id) of the earliest plant, or None when empty."""
+        heap = self._heap
+        while heap:
+            due, token, plant_id = heap[0]
+            state = self._plants.get(plant_id)
+            if state is not None and state[4] == token:
+                return due, plant_id
+            heapq.heappop(heap)
+        return None
+
+    def pop_due(self, now: float, water: bool = True) -> list:
+        """Return the ids of all plants due at or before now.
+
+        With water=True the plants are treated as watered at now and their
+        next watering is scheduled; otherwise they stop being tracked.
+        """
+        heap = self._heap
+        plants = self._plants
+        due_ids = []
+        while heap and heap[0][0] <= now:
+            due, token, plant_id = heapq.heappop(heap)
+            state = plants.get(plant_id)
+            if state is None or state[4] != token:
+                continue
+            due_ids.append(plant_id)
+        for plant_id in due_ids:
+            if water:
+                self.watered(plant_id, now)
+            else:
+                del plants[plant_id]
+        return due_ids
@@ -0,0 +1,101 @@
+"""Long-lived asyncio advisory service over a TCP or Unix socket.
+
+Protocol: newline-delimited JSON. Each request line is either one reading
+object or a list of them (a batch); each response line is a result object or
+a list of results in the same order. Clients may pipeline any number of lines
+without waiting for responses, which always come back in request order.
+
+    {"id": 7, "plant_type": 2, "season": 1, "temperature": 25.0, "humidity": 50}
+    {"id": 7, "instructions": "Watering Schedule: Every 3 days\\n..."}
+"""
+
+import argparse
+import asyncio
+import json
+
+import care_table
+
+FIELDNAMES = ("plant_type", "season", "temperature", "humidity")
+MAX_LINE_BYTES = 1 << 24
+
+
+def handle_request(request, evaluate=care_table.generate_care_instructions) -> dict:
+    """Evaluate one request object and build its response object."""
+    response = {}
+    if isinstance(request, dict) and "id" in request:
+        response["id"] = request["id"]
+    try:
+        if not isinstance(request, dict):
+            raise ValueError("Request must be a JSON object.")
+        response["instructions"] = evaluate(*(request.get(name) for name in FIELDNAMES))
+    except ValueError as e:
+        response["error"] = str(e)
+    return response
+
+
+def handle_line(line: bytes, evaluate=care_table.generate_care_instructions):
+    """Decode one protocol line and return the response payload."""
+    try:
+        payload = json.loads(line)
+    except ValueError:
+        return {"error": "Malformed JSON request."}
+    if isinstance(payload, list):
+        return [handle_request(request, evaluate) for request in payload]
+    return handle_request(payload, evaluate)
+
+
+class AdvisoryServer:
+    """Serves care instructions to many concurrent clients from one process."""
+
+    def __init__(self, evaluate=care_table.generate_care_instructions):
+        self.evaluate = evaluate
+        self.server = None
+        care_table.get_table()
+
+    async def handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Answer every line from one connection, in order, until it closes."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                writer.write(json.dumps(handle_line(line, self.evaluate)).encode() + b"\n")
+                # Only blocks when the client stops reading (write buffer over high-water mark)
+                await writer.drain()
+        except (ConnectionError, asyncio.LimitOverrunError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765, path: str = None):
+        """Start listening on a TCP port, or on a Unix socket when path is given."""
+        if path:
+            self.server = await asyncio.start_unix_server(self.handle_client, path=path, limit=MAX_LINE_BYTES)
+        else:
+            self.server = await asyncio.start_server(self.handle_client, host, port, limit=MAX_LINE_BYTES)
+        return self.server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765, path: str = None):
+        """Start the server and run until cancelled."""
+        server = await self.start(host, port, path)
+        async with server:
+            await server.serve_forever()
+
+
+def main(argv=None):
+    """Command-line entry point for the advisory daemon."""
+    parser = argparse.ArgumentParser(description="Run the plant care advisory service.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(AdvisoryServer().serve_forever(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
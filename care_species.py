@@ -0,0 +1,241 @@
+"""Species registry: per-species care values looked up by id instead of branching.
+
+The four SRS plant types are built in as species 1-4. More species are loaded
+from a CSV data file with the columns
+
+    species_id,name,watering_days,sunlight,care,low_temperature,high_temperature,low_humidity,high_humidity
+
+where the four threshold columns may be left empty to use the SRS defaults.
+Every attribute is stored in a list indexed by species id, so a lookup costs
+one index however many species are registered. Temperature and humidity are
+classified with care_bands tables; species may register tables with more
+bands than the SRS three.
+"""
+
+import csv
+import os
+
+import numpy as np
+
+import care_batch
+import care_bands
+import care_rules
+
+MAX_SPECIES_ID = 65535
+# columns() stores watering days as int16, and winter adds a day
+MAX_WATERING_DAYS = 32766
+# Catalog entries store text lengths as uint16
+MAX_TEXT_BYTES = 65535
+
+COLUMNS = (
+    "species_id", "name", "watering_days", "sunlight", "care",
+    "low_temperature", "high_temperature", "low_humidity", "high_humidity",
+)
+
+_default = None
+
+
+class SpeciesRegistry:
+    """Dense, id-indexed tables of species care values."""
+
+    def __init__(self, builtins: bool = True):
+        self.names = [None]
+        self.watering = [None]
+        self.sunlight = [None]
+        self.care = [None]
+        # (low_temperature, high_temperature, low_humidity, high_humidity) per species,
+        # or None when the species registered its own band tables
+        self.thresholds = [None]
+        # Distinct band tables, and per species the index of its table in each list
+        self.temperature_tables = []
+        self.humidity_tables = []
+        self.temperature_table_ids = [None]
+        self.humidity_table_ids = [None]
+        self._table_ids = {}
+        self.count = 0
+        self._columns = None
+        if builtins:
+            for index, name in enumerate(care_rules.PLANT_TYPES):
+                self.register(
+                    index + 1, name, care_rules.WATERING_DAYS[index],
+                    care_rules.SUNLIGHT_REQUIREMENTS[index], care_rules.PLANT_CARE[index],
+                )
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, species_id) -> bool:
+        return isinstance(species_id, int) and not isinstance(species_id, bool) \
+            and 0 < species_id < len(self.names) and self.names[species_id] is not None
+
+    def register(self, species_id: int, name: str, watering_days: int, sunlight: str, care: str,
+                 low_temperature: float = care_rules.LOW_TEMPERATURE,
+                 high_temperature: float = care_rules.HIGH_TEMPERATURE,
+                 low_humidity: int = care_rules.LOW_HUMIDITY,
+                 high_humidity: int = care_rules.HIGH_HUMIDITY,
+                 temperature_bands: care_bands.BandTable = None,
+                 humidity_bands: care_bands.BandTable = None) -> None:
+        """Add or replace a species.
+
+        temperature_bands and humidity_bands replace the low/high thresholds
+        with arbitrary band tables.
+        """
+        if isinstance(species_id, bool) or not isinstance(species_id, int) \
+                or not 1 <= species_id <= MAX_SPECIES_ID:
+            raise ValueError(f"Species id must be an integer between 1 and {MAX_SPECIES_ID}.")
+        if isinstance(watering_days, bool) or not isinstance(watering_days, int) \
+                or not 1 <= watering_days <= MAX_WATERING_DAYS:
+            raise ValueError(f"Watering days must be an integer between 1 and {MAX_WATERING_DAYS}.")
+        if not all(isinstance(value, int) and not isinstance(value, bool)
+                   and care_rules.MIN_HUMIDITY <= value <= care_rules.MAX_HUMIDITY
+                   for value in (low_humidity, high_humidity)):
+            raise ValueError(f"Humidity thresholds must be integers between {care_rules.MIN_HUMIDITY} "
+                             f"and {care_rules.MAX_HUMIDITY}.")
+        if any(len(text.encode("utf-8")) > MAX_TEXT_BYTES for text in (name, sunlight, care)):
+            raise ValueError(f"Name, sunlight and care texts must be at most {MAX_TEXT_BYTES} bytes.")
+        if not low_temperature <= high_temperature or not low_humidity <= high_humidity:
+            raise ValueError("Low thresholds must not exceed high thresholds.")
+        if species_id >= len(self.names):
+            grow = [None] * (species_id + 1 - len(self.names))
+            for column in (self.names, self.watering, self.sunlight, self.care, self.thresholds,
+                           self.temperature_table_ids, self.humidity_table_ids):
+                column.extend(grow)
+        if self.names[species_id] is None:
+            self.count += 1
+        self.names[species_id] = name
+        self.watering[species_id] = watering_days
+        self.sunlight[species_id] = sunlight
+        self.care[species_id] = care
+        if temperature_bands is None and humidity_bands is None:
+            self.thresholds[species_id] = (float(low_temperature), float(high_temperature), low_humidity, high_humidity)
+        else:
+            self.thresholds[species_id] = None
+        self.temperature_table_ids[species_id] = self._intern(
+            self.temperature_tables, temperature_bands or care_bands.temperature_table(low_temperature, high_temperature))
+        self.humidity_table_ids[species_id] = self._intern(
+            self.humidity_tables, humidity_bands or care_bands.humidity_table(low_humidity, high_humidity))
+        self._columns = None
+
+    def _intern(self, tables: list, table: care_bands.BandTable) -> int:
+        """Return the index of table in tables, appending it the first time it is seen."""
+        key = (id(tables), table)
+        if key not in self._table_ids:
+            self._table_ids[key] = len(tables)
+            tables.append(table)
+        return self._table_ids[key]
+
+    def load(self, path) -> int:
+        """Register every species in a CSV data file; return how many were read."""
+        count = 0
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                missing = [column for column in COLUMNS[:5] if not row.get(column)]
+                if missing:
+                    raise ValueError(f"{path}: line {count + 2}: missing {', '.join(missing)}")
+                thresholds = {}
+                for column, convert in (("low_temperature", float), ("high_temperature", float),
+                                        ("low_humidity", int), ("high_humidity", int)):
+                    if row.get(column):
+                        thresholds[column] = convert(row[column])
+                self.register(int(row["species_id"]), row["name"], int(row["watering_days"]),
+                              row["sunlight"], row["care"], **thresholds)
+                count += 1
+        return count
+
+    def check(self, species_id) -> None:
+        """Raise the skeleton's plant type errors for an unknown species id."""
+        if isinstance(species_id, bool) or not isinstance(species_id, int):
+            raise ValueError("Plant type must be an integer.")
+        if species_id not in self:
+            raise ValueError("Invalid plant type")
+
+    def watering_days(self, species_id: int) -> int:
+        """Registry equivalent of calculate_watering_schedule."""
+        self.check(species_id)
+        return self.watering[species_id]
+
+    def sunlight_requirement(self, species_id: int) -> str:
+        """Registry equivalent of get_sunlight_requirement."""
+        self.check(species_id)
+        return self.sunlight[species_id]
+
+    def species_thresholds(self, species_id: int) -> tuple:
+        """Return (low_temperature, high_temperature, low_humidity, high_humidity), or None for custom bands."""
+        self.check(species_id)
+        return self.thresholds[species_id]
+
+    def bands(self, species_id: int) -> tuple:
+        """Return the species' (temperature, humidity) band tables."""
+        self.check(species_id)
+        return (self.temperature_tables[self.temperature_table_ids[species_id]],
+                self.humidity_tables[self.humidity_table_ids[species_id]])
+
+    def advise(self, species_id: int, season: int, temperature: float, humidity: int) -> str:
+        """Validate a reading and render its instructions with the species' values."""
+        self.check(species_id)
+        care_rules.validate_conditions(season, temperature, humidity)
+        return care_bands.render(
+            self.watering[species_id], self.sunlight[species_id], self.care[species_id],
+            self.temperature_tables[self.temperature_table_ids[species_id]],
+            self.humidity_tables[self.humidity_table_ids[species_id]],
+            season, temperature, humidity,
+        )
+
+    def classify_batch(self, species_id, temperature, humidity) -> tuple[np.ndarray, np.ndarray]:
+        """Return (temperature bands, humidity bands) for parallel arrays, each species with its own tables."""
+        columns = self.columns()
+        species_id = care_batch.as_integer_array(species_id, "Plant type must be an integer.")
+        temperature = np.asarray(temperature).ravel()
+        humidity = np.asarray(humidity).ravel()
+        if not species_id.size == temperature.size == humidity.size:
+            raise ValueError("Input arrays must have the same length.")
+        if species_id.size and (species_id.min() < 1 or species_id.max() >= len(self.names)
+                                or not columns["watering_days"][species_id].all()):
+            raise ValueError("Invalid plant type")
+        return (
+            care_bands.classify_grouped(self.temperature_tables, columns["temperature_table"][species_id], temperature),
+            care_bands.classify_grouped(self.humidity_tables, columns["humidity_table"][species_id], humidity),
+        )
+
+    def entries(self):
+        """Yield every registered species as a tuple in COLUMNS order, by id."""
+        for species_id, name in enumerate(self.names):
+            if name is not None:
+                if self.thresholds[species_id] is None:
+                    raise ValueError(f"Species {species_id} has custom band tables, which have no CSV/catalog form.")
+                yield (species_id, name, self.watering[species_id], self.sunlight[species_id],
+                       self.care[species_id], *self.thresholds[species_id])
+
+    def columns(self) -> dict[str, np.ndarray]:
+        """Return per-species arrays indexed by species id, for batch evaluation.
+
+        "temperature_table" and "humidity_table" index temperature_tables and
+        humidity_tables. Unregistered ids have watering_days 0 and table -1.
+        The arrays are rebuilt after a register().
+        """
+        if self._columns is None:
+            size = len(self.names)
+            watering = np.zeros(size, dtype=np.int16)
+            tables = np.full((size, 2), -1, dtype=np.int32)
+            for species_id in range(1, size):
+                if self.names[species_id] is not None:
+                    watering[species_id] = self.watering[species_id]
+                    tables[species_id] = (self.temperature_table_ids[species_id], self.humidity_table_ids[species_id])
+            self._columns = {
+                "watering_days": watering,
+                "temperature_table": tables[:, 0],
+                "humidity_table": tables[:, 1],
+            }
+        return self._columns
+
+
+def default_registry() -> SpeciesRegistry:
+    """Return the shared registry: built-ins plus the file named by PLANT_CARE_SPECIES, if set."""
+    global _default
+    if _default is None:
+        registry = SpeciesRegistry()
+        path = os.environ.get("PLANT_CARE_SPECIES")
+        if path:
+            registry.load(path)
+        _default = registry
+    return _default
@@ -0,0 +1,197 @@
+"""Streaming sensor ingestion: CSV/JSONL readings in, JSONL advice out.
+
+Everything here is a generator over the input stream, so memory use stays
+constant regardless of file size. Input is read with read1(), which returns
+whatever is already available instead of waiting for a full chunk, and output
+is written in blocks that are flushed whenever the reader is about to wait for
+more input, so lines piped in one at a time are answered one at a time.
+"""
+
+import argparse
+import codecs
+import csv
+import json
+import sys
+
+import care_table
+
+FIELDNAMES = ("plant_type", "season", "temperature", "humidity")
+DEFAULT_CHUNK_SIZE = 1 << 20
+DEFAULT_FLUSH_LINES = 4096
+CONVERTERS = (int, int, float, int)
+
+
+def read_chunks(stream, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield text from a stream as it arrives, at most chunk_size bytes per read.
+
+    Text files and stdin are read through their binary buffer with read1() and
+    an incremental decoder; streams without one (e.g. StringIO) use read().
+    """
+    raw = getattr(stream, "buffer", None)
+    if raw is None or not hasattr(raw, "read1"):
+        yield from iter(lambda: stream.read(chunk_size), "")
+        return
+    decoder = codecs.getincrementaldecoder(stream.encoding)(stream.errors)
+    while True:
+        data = raw.read1(chunk_size)
+        text = decoder.decode(data, final=not data)
+        if text:
+            yield text
+        if not data:
+            break
+
+
+def iter_lines(stream, chunk_size: int = DEFAULT_CHUNK_SIZE, before_read=None):
+    """Yield complete lines from a text stream as soon as each one has arrived.
+
+    before_read, if given, is called before every read of the stream.
+    """
+    pending = ""
+    chunks = read_chunks(stream, chunk_size)
+    while True:
+        if before_read is not None:
+            before_read()
+        chunk = next(chunks, "")
+        if not chunk:
+            break
+        lines = (pending + chunk).split("\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line
+    if pending:
+        yield pending
+
+
+def parse_reading(values) -> tuple:
+    """Convert raw field values to (plant_type, season, temperature, humidity).
+
+    Only text values (CSV fields, quoted JSON values) are converted; typed JSON
+    values pass through unchanged, so validation rejects 2.9 or true as a plant
+    type instead of truncating it.
+    """
+    try:
+        return tuple(
+            convert(value) if isinstance(value, str) else value
+            for convert, value in zip(CONVERTERS, values)
+        )
+    except ValueError:
+        raise ValueError("Reading fields must be numeric.")
+
+
+def read_csv(lines):
+    """Yield raw readings from CSV lines with a plant_type,season,temperature,humidity header."""
+    for row in csv.DictReader(lines):
+        yield tuple(row.get(name) for name in FIELDNAMES)
+
+
+def read_jsonl(lines):
+    """Yield the non-blank lines of JSON Lines input; decode_jsonl parses each one."""
+    for line in lines:
+        if line.strip():
+            yield line
+
+
+def decode_jsonl(line: str) -> tuple:
+    """Parse one JSON line into raw reading values."""
+    try:
+        record = json.loads(line)
+    except ValueError as e:
+        raise ValueError(f"Invalid JSON: {e}")
+    if not isinstance(record, dict):
+        raise ValueError("Each JSON line must be an object.")
+    return tuple(record.get(name) for name in FIELDNAMES)
+
+
+# Format -> (reader, decoder); the decoder runs per record inside advise()'s error handling
+READERS = {"csv": (read_csv, None), "jsonl": (read_jsonl, decode_jsonl)}
+
+
+def advise(readings, evaluate=care_table.generate_care_instructions, decode=None):
+    """Yield a result dict for each raw reading, recording decoding and validation errors."""
+    for record in readings:
+        if decode is None:
+            values = record
+        else:
+            try:
+                values = decode(record)
+            except ValueError as e:
+                yield {"line": record.rstrip("\r"), "error": str(e)}
+                continue
+        result = dict(zip(FIELDNAMES, values))
+        try:
+            reading = parse_reading(values)
+            result.update(zip(FIELDNAMES, reading))
+            result["instructions"] = evaluate(*reading)
+        except ValueError as e:
+            result["error"] = str(e)
+        yield result
+
+
+class BlockWriter:
+    """Collects results as JSON Lines and writes them to out in blocks of flush_lines."""
+
+    def __init__(self, out, flush_lines: int = DEFAULT_FLUSH_LINES):
+        self.out = out
+        self.flush_lines = flush_lines
+        self.buffer = []
+        self.count = 0
+
+    def write(self, result: dict) -> None:
+        self.buffer.append(json.dumps(result))
+        self.count += 1
+        if len(self.buffer) >= self.flush_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write and flush the buffered block, if any."""
+        if self.buffer:
+            self.out.write("\n".join(self.buffer) + "\n")
+            self.buffer.clear()
+            self.out.flush()
+
+
+def write_jsonl(results, out, flush_lines: int = DEFAULT_FLUSH_LINES, writer: BlockWriter = None) -> int:
+    """Write results as JSON Lines in bulk blocks; return the number written."""
+    writer = writer or BlockWriter(out, flush_lines)
+    for result in results:
+        writer.write(result)
+    writer.flush()
+    return writer.count
+
+
+def run_pipeline(source, out, fmt: str = "csv", chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 flush_lines: int = DEFAULT_FLUSH_LINES, evaluate=care_table.generate_care_instructions) -> int:
+    """Stream readings from source through the advisor into out."""
+    if fmt not in READERS:
+        raise ValueError(f"Unsupported format: {fmt}")
+    reader, decode = READERS[fmt]
+    # Results for everything read so far go out before the next (possibly blocking) read
+    writer = BlockWriter(out, flush_lines)
+    lines = iter_lines(source, chunk_size, before_read=writer.flush)
+    return write_jsonl(advise(reader(lines), evaluate, decode), out, writer=writer)
+
+
+def main(argv=None):
+    """Command-line entry point for the streaming pipeline."""
+    parser = argparse.ArgumentParser(description="Stream sensor readings through the plant care advisor.")
+    parser.add_argument("input", nargs="?", help="CSV or JSONL file (default: stdin)")
+    parser.add_argument("-o", "--output", help="JSONL output file (default: stdout)")
+    parser.add_argument("-f", "--format", choices=sorted(READERS), help="input format (default: from extension)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--flush-lines", type=int, default=DEFAULT_FLUSH_LINES)
+    args = parser.parse_args(argv)
+
+    fmt = args.format or ("jsonl" if args.input and args.input.endswith((".jsonl", ".json")) else "csv")
+    source = open(args.input, "r", newline="") if args.input else sys.stdin
+    out = open(args.output, "w") if args.output else sys.stdout
+    try:
+        run_pipeline(source, out, fmt, args.chunk_size, args.flush_lines)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
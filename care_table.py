@@ -0,0 +1,47 @@
+"""Precompiled advice table covering every equivalence class of inputs.
+
+The care instructions depend only on plant type (4), season (4), temperature
+band (3) and humidity band (3), so all 144 results are rendered once on first
+use and each request becomes a validation, two comparisons and an index.
+"""
+
+import care_rules
+
+CLASS_COUNT = len(care_rules.PLANT_TYPES) * len(care_rules.SEASONS) * 3 * 3
+
+_table = None
+
+
+def class_index(plant_type: int, season: int, temp_band: int, hum_band: int) -> int:
+    """Return the table slot for an equivalence class."""
+    return (((plant_type - 1) * 4 + (season - 1)) * 3 + temp_band) * 3 + hum_band
+
+
+def build_table() -> tuple[str, ...]:
+    """Render the instructions for all equivalence classes in class_index order."""
+    return tuple(
+        care_rules.render_instructions(plant_type, season, temp_band, hum_band)
+        for plant_type in range(1, 5)
+        for season in range(1, 5)
+        for temp_band in range(3)
+        for hum_band in range(3)
+    )
+
+
+def get_table() -> tuple[str, ...]:
+    """Return the advice table, building it on first use."""
+    global _table
+    if _table is None:
+        _table = build_table()
+    return _table
+
+
+def generate_care_instructions(plant_type: int, season: int, temperature: float, humidity: int) -> str:
+    """Table-driven equivalent of skeleton.generate_care_instructions."""
+    care_rules.validate_reading(plant_type, season, temperature, humidity)
+    return get_table()[class_index(
+        plant_type,
+        season,
+        care_rules.temperature_band(temperature),
+        care_rules.humidity_band(humidity),
+    )]
@@ -1,3 +1,5 @@
+import sys
+
 def calculate_watering_schedule(plant_type: int) -> int:
     """Calculate watering frequency in days based on plant type."""
     if not isinstance(plant_type, int):
@@ -106,5 +108,58 @@ def main():
     # 4. Handle potential errors with try-except
     pass
 
+BATCH_FLUSH_LINES = 8192
+
+def run_batch(lines, out) -> int:
+    """Evaluate many readings without prompts, writing results in large blocks.
+
+    Each input line holds plant_type, season, temperature and humidity separated
+    by commas or whitespace. Each output line is the input line number, a tab and
+    either the instructions (joined with " | "), an "Input Error:" message, or an
+    "Evaluation Error:" message when generate_care_instructions does not return
+    a string. Returns the number of readings processed and the number of
+    evaluation errors.
+    """
+    buffer = []
+    count = 0
+    failed = 0
+    for line_number, line in enumerate(lines, 1):
+        fields = line.replace(",", " ").split()
+        if not fields or fields[0].startswith("#") or fields[0] == "plant_type":
+            continue
+        count += 1
+        try:
+            if len(fields) != 4:
+                raise ValueError("Expected plant_type, season, temperature and humidity.")
+            instructions = generate_care_instructions(int(fields[0]), int(fields[1]), float(fields[2]), int(fields[3]))
+            if isinstance(instructions, str):
+                buffer.append(f"{line_number}\t{instructions.replace(chr(10), ' | ')}")
+            else:
+                failed += 1
+                buffer.append(f"{line_number}\tEvaluation Error: generate_care_instructions returned "
+                              f"{type(instructions).__name__}, expected str")
+        except ValueError as e:
+            buffer.append(f"{line_number}\tInput Error: {e}")
+        if len(buffer) >= BATCH_FLUSH_LINES:
+            out.write("\n".join(buffer) + "\n")
+            buffer.clear()
+    if buffer:
+        out.write("\n".join(buffer) + "\n")
+    out.flush()
+    return count, failed
+
+def batch_main(args):
+    """Run bulk mode: python skeleton.py --batch [FILE] (reads stdin without FILE)."""
+    if args:
+        with open(args[0], "r") as source:
+            count, failed = run_batch(source, sys.stdout)
+    else:
+        count, failed = run_batch(sys.stdin, sys.stdout)
+    if failed:
+        sys.exit(f"{failed} of {count} readings could not be evaluated")
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if sys.argv[1:2] == ["--batch"]:
+        batch_main(sys.argv[2:])
+    else:
+        main()
\ No newline at end of file
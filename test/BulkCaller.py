@@ -0,0 +1,49 @@
+import contextlib
+import io
+
+class CallOutcome:
+    """Result of one case run by BulkCaller."""
+    __slots__ = ("function_name", "args", "value", "exception", "missing", "case")
+
+    def __init__(self, function_name, args, case):
+        self.function_name = function_name
+        self.args = args
+        self.case = case
+        self.value = None
+        self.exception = None
+        self.missing = False
+
+    def raised(self, expected_exception=ValueError):
+        """True when the call raised expected_exception (what check_raises_exception tests)."""
+        return isinstance(self.exception, expected_exception)
+
+    @property
+    def result(self):
+        """The return value, or None on any failure (what safely_call_function returns)."""
+        return None if self.exception is not None else self.value
+
+class BulkCaller:
+    """Runs a whole table of calls under a single stdout redirect.
+
+    Each case is (function_name, args, *extra); the extra items (expected values,
+    descriptions) are kept on the outcome as `case` so callers can report them.
+    Every case gets its own exception boundary, so one failure never stops the table.
+    """
+
+    @staticmethod
+    def run(module, cases):
+        outcomes = []
+        with contextlib.redirect_stdout(io.StringIO()):
+            for case in cases:
+                function_name, args = case[0], case[1]
+                outcome = CallOutcome(function_name, args, case)
+                function = getattr(module, function_name, None)
+                if not callable(function):
+                    outcome.missing = True
+                else:
+                    try:
+                        outcome.value = function(*args)
+                    except Exception as e:
+                        outcome.exception = e
+                outcomes.append(outcome)
+        return outcomes
@@ -0,0 +1,139 @@
+import argparse
+import importlib
+import importlib.util
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import care_batch
+import care_rules
+import care_table
+
+# The whole valid input domain: 4 plant types x 4 seasons x 601 temperatures (0.1 degree
+# steps from -10.0 to 50.0) x 101 humidity values
+PLANT_TYPES = list(range(1, 5))
+SEASONS = list(range(1, 5))
+TEMPERATURES = (np.arange(-100, 501) / 10).tolist()
+HUMIDITIES = list(range(0, 101))
+MAX_DAYS = 30
+MAX_MISMATCHES = 10
+
+class DomainSweep:
+    """Checks a module's advisory functions against a NumPy oracle over the whole valid domain.
+
+    generate_care_instructions is swept over every (plant type, season) pair in a separate
+    process; the helpers' domains are small enough to check in the parent. The report lists
+    the number of cases checked and the first mismatching inputs per function.
+    """
+
+    @staticmethod
+    def load(target):
+        """Import a module by name, or from a .py file path (so a solution outside the tree can be swept)."""
+        if not target.endswith(".py"):
+            return importlib.import_module(target)
+        name = os.path.splitext(os.path.basename(target))[0]
+        spec = importlib.util.spec_from_file_location(name, target)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+
+    @staticmethod
+    def call(function, args):
+        try:
+            return function(*args)
+        except Exception as e:
+            return f"raised {type(e).__name__}: {e}"
+
+    @staticmethod
+    def compare(name, function, args_list, expected):
+        mismatches = []
+        for args, want in zip(args_list, expected):
+            got = DomainSweep.call(function, args)
+            if got != want:
+                mismatches.append((name, args, want, got))
+                if len(mismatches) >= MAX_MISMATCHES:
+                    break
+        return mismatches
+
+    @staticmethod
+    def sweep_pair(module_name, plant_type, season):
+        """Worker: check generate_care_instructions for one plant type and season."""
+        module = DomainSweep.load(module_name)
+        temperature, humidity = np.meshgrid(TEMPERATURES, HUMIDITIES, indexing="ij")
+        temperature = temperature.ravel()
+        humidity = humidity.ravel()
+        count = temperature.size
+        classes = ((plant_type - 1) * 4 + (season - 1)) * 9 \
+            + care_batch.temperature_bands(temperature).astype(np.int64) * 3 + care_batch.humidity_bands(humidity)
+        texts = np.array(care_table.get_table(), dtype=object)[classes]
+        args_list = [(plant_type, season, t, h) for t, h in zip(temperature.tolist(), humidity.tolist())]
+        mismatches = DomainSweep.compare(
+            "generate_care_instructions", module.generate_care_instructions, args_list, texts.tolist())
+        return count, mismatches
+
+    @staticmethod
+    def sweep_helpers(module):
+        checks = []
+        types = np.array(PLANT_TYPES)
+        checks.append(("calculate_watering_schedule", [(t,) for t in PLANT_TYPES],
+                       care_batch.WATERING_DAYS[types - 1].tolist()))
+        checks.append(("get_sunlight_requirement", [(t,) for t in PLANT_TYPES],
+                       np.array(care_rules.SUNLIGHT_REQUIREMENTS, dtype=object)[types - 1].tolist()))
+        days, seasons = np.meshgrid(np.arange(MAX_DAYS + 1), SEASONS, indexing="ij")
+        days = days.ravel()
+        seasons = seasons.ravel()
+        checks.append(("adjust_for_season", list(zip(days.tolist(), seasons.tolist())),
+                       care_batch.season_adjusted_days(days, seasons).tolist()))
+        temperatures = np.array(TEMPERATURES)
+        checks.append(("check_temperature", [(t,) for t in TEMPERATURES],
+                       np.array(care_rules.TEMPERATURE_STATUS, dtype=object)[
+                           care_batch.temperature_bands(temperatures)].tolist()))
+        humidity_needs = np.empty(len(care_rules.HUMIDITY_NEEDS), dtype=object)
+        humidity_needs[:] = care_rules.HUMIDITY_NEEDS
+        checks.append(("determine_humidity_needs", [(h,) for h in HUMIDITIES],
+                       humidity_needs[care_batch.humidity_bands(np.array(HUMIDITIES))].tolist()))
+        results = {}
+        for name, args_list, expected in checks:
+            results[name] = (len(args_list), DomainSweep.compare(name, getattr(module, name), args_list, expected))
+        return results
+
+    @staticmethod
+    def run(module_name="skeleton", workers=None):
+        """Sweep the module; return {function_name: (cases_checked, mismatches)}."""
+        module = DomainSweep.load(module_name)
+        results = DomainSweep.sweep_helpers(module)
+        pairs = [(plant_type, season) for plant_type in PLANT_TYPES for season in SEASONS]
+        total = 0
+        mismatches = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(DomainSweep.sweep_pair, module_name, *pair) for pair in pairs]
+            for future in futures:
+                count, found = future.result()
+                total += count
+                mismatches.extend(found[:MAX_MISMATCHES - len(mismatches)])
+        results["generate_care_instructions"] = (total, mismatches)
+        return results
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sweep the whole valid input domain against the reference oracle.")
+    parser.add_argument("module", nargs="?", default="skeleton", help="module name or path to a .py file")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = DomainSweep.run(args.module, args.workers)
+    failed = False
+    for name, (count, mismatches) in results.items():
+        status = "OK" if not mismatches else f"{len(mismatches)}{'+' if len(mismatches) >= MAX_MISMATCHES else ''} MISMATCHES"
+        print(f"{name:30} {count:>9,} cases  {status}")
+        for _, case_args, want, got in mismatches:
+            print(f"    {name}{case_args}: expected {want!r}, got {got!r}")
+        failed = failed or bool(mismatches)
+    print(f"Swept in {time.perf_counter() - start:.2f}s")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
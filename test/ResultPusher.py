@@ -0,0 +1,210 @@
+import atexit
+import contextlib
+import getpass
+import hashlib
+import json
+import os
+import queue
+import tempfile
+import threading
+import uuid
+import requests
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the in-process lock guards the spool
+    fcntl = None
+
+class ResultPusher:
+    """Delivers result payloads from a background thread.
+
+    Payloads go on a bounded queue drained by a worker thread, so callers never
+    wait on the network. Payloads that cannot be delivered (endpoint unreachable,
+    bad status, queue full, or still queued or in flight at exit) are appended to
+    a JSONL spool file. When the next pusher starts it replays the whole spool
+    in one bulk POST over its pooled session (see replay_spool). A payload
+    whose POST was still running at exit is spooled too, so it may be delivered twice.
+    """
+    QUEUE_SIZE = 1000
+    EXIT_TIMEOUT = 10.0
+    STOP = object()
+
+    def __init__(self, url, spool_file=None, timeout=10.0):
+        self.url = url
+        self.spool_file = spool_file or self.default_spool_file()
+        self.timeout = timeout
+        self.queue = queue.Queue(maxsize=self.QUEUE_SIZE)
+        self.session = requests.Session()
+        self.spool_lock = threading.Lock()
+        # Guards in_flight and stopped between the worker and close()
+        self.state_lock = threading.Lock()
+        self.in_flight = None
+        self.stopped = False
+        self.closed = False
+        self.worker = threading.Thread(target=self.run, name="yaksha-result-pusher", daemon=True)
+        self.worker.start()
+        atexit.register(self.close)
+
+    @staticmethod
+    def default_spool_file():
+        """Spool path for this user and workspace, in a directory only the user can read."""
+        if os.environ.get("YAKSHA_SPOOL_FILE"):
+            return os.environ["YAKSHA_SPOOL_FILE"]
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = str(os.getpid())
+        directory = os.path.join(tempfile.gettempdir(), f"yaksha-spool-{user}")
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        workspace = hashlib.sha256(os.getcwd().encode("utf-8")).hexdigest()[:16]
+        return os.path.join(directory, f"results-{workspace}.jsonl")
+
+    @staticmethod
+    @contextlib.contextmanager
+    def locked_spool(spool_file):
+        """Hold an exclusive lock on the spool across processes, where the platform supports it."""
+        if fcntl is None:
+            yield
+            return
+        with open(spool_file + ".lock", "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    @staticmethod
+    def write_spool(spool_file, payloads):
+        with ResultPusher.locked_spool(spool_file):
+            fd = os.open(spool_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "a") as f:
+                for payload in payloads:
+                    f.write(json.dumps(payload) + "\n")
+
+    def post(self, payload):
+        try:
+            response = self.session.post(self.url, json.dumps(payload), timeout=self.timeout,
+                                         headers={"Content-Type": "application/json"})
+            return response.status_code in [200, 201]
+        except requests.RequestException:
+            return False
+
+    def spool(self, payloads):
+        with self.spool_lock:
+            self.write_spool(self.spool_file, payloads)
+
+    @staticmethod
+    def replay_spool(spool_file, post, lock=None):
+        """Resend every spooled result in one bulk POST; return how many payloads were delivered.
+
+        Spooled payloads are single results or lists of results; they are sent
+        as one flat JSON list, the shape batched mode already posts. If the POST
+        fails the payloads are spooled again unchanged. Lines that are not valid
+        JSON (such as a partial line left by a process killed mid-write) are
+        moved to a .corrupt file next to the spool.
+        """
+        pending = f"{spool_file}.{os.getpid()}.{uuid.uuid4().hex}.replay"
+        with lock or contextlib.nullcontext(), ResultPusher.locked_spool(spool_file):
+            try:
+                os.replace(spool_file, pending)
+            except FileNotFoundError:
+                return 0
+        payloads = []
+        corrupt = []
+        with open(pending, "r") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    payloads.append(json.loads(line))
+                except ValueError:
+                    corrupt.append(line if line.endswith("\n") else line + "\n")
+        if corrupt:
+            fd = os.open(spool_file + ".corrupt", os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+            with os.fdopen(fd, "a") as f:
+                f.writelines(corrupt)
+        delivered = 0
+        if payloads:
+            results = []
+            for payload in payloads:
+                results.extend(payload if isinstance(payload, list) else [payload])
+            if post(results):
+                delivered = len(payloads)
+            else:
+                with lock or contextlib.nullcontext():
+                    ResultPusher.write_spool(spool_file, payloads)
+        os.remove(pending)
+        return delivered
+
+    def replay(self):
+        return self.replay_spool(self.spool_file, self.post, self.spool_lock)
+
+    def submit(self, payload):
+        """Queue a payload for delivery without blocking."""
+        try:
+            self.queue.put_nowait(payload)
+        except queue.Full:
+            self.spool([payload])
+
+    def deliver(self, payload):
+        """Post one payload; spool it on failure unless close() has already taken it over."""
+        with self.state_lock:
+            if self.stopped:
+                self.spool([payload])
+                return
+            self.in_flight = payload
+        delivered = self.post(payload)
+        with self.state_lock:
+            if self.in_flight is not payload:
+                return
+            self.in_flight = None
+            if not delivered:
+                self.spool([payload])
+
+    def run(self):
+        try:
+            self.replay()
+        except Exception:
+            pass
+        while True:
+            payload = self.queue.get()
+            try:
+                if payload is self.STOP:
+                    return
+                self.deliver(payload)
+            except Exception:
+                pass
+            finally:
+                self.queue.task_done()
+
+    def close(self):
+        """Stop the worker, waiting up to EXIT_TIMEOUT, and spool anything undelivered.
+
+        Queued payloads are spooled even when the worker has died, and so is a
+        payload whose POST is still running when the wait times out.
+        """
+        if self.closed:
+            return
+        self.closed = True
+        if self.worker.is_alive():
+            try:
+                self.queue.put(self.STOP, timeout=self.EXIT_TIMEOUT)
+            except queue.Full:
+                pass
+            self.worker.join(self.EXIT_TIMEOUT)
+        with self.state_lock:
+            self.stopped = True
+            leftover = []
+            if self.in_flight is not None:
+                leftover.append(self.in_flight)
+                self.in_flight = None
+            while True:
+                try:
+                    payload = self.queue.get_nowait()
+                except queue.Empty:
+                    break
+                if payload is not self.STOP:
+                    leftover.append(payload)
+            if leftover:
+                self.spool(leftover)
+        self.session.close()
@@ -0,0 +1,85 @@
+import ast
+import hashlib
+import inspect
+import io
+import keyword
+import tokenize
+from collections import Counter
+
+class FunctionFacts:
+    """Structural facts about one function, computed from its tokens and AST."""
+    def __init__(self, name, keywords, chains):
+        self.name = name
+        # Python keywords in source order, excluding strings and comments
+        self.keywords = keywords
+        self.keyword_counts = Counter(keywords)
+        # One (elif_count, has_else) entry per if/elif/else chain
+        self.chains = chains
+
+    def uses(self, keyword_name):
+        return self.keyword_counts[keyword_name] > 0
+
+    def count(self, keyword_name):
+        return self.keyword_counts[keyword_name]
+
+    def has_sequence(self, keywords):
+        """True when the keywords appear in this order (not necessarily adjacent)."""
+        remaining = iter(self.keywords)
+        return all(any(token == wanted for token in remaining) for wanted in keywords)
+
+    def branch_count(self):
+        return self.count("if") + self.count("elif") + self.count("else")
+
+class StructureAnalyzer:
+    """Parses a module once with ast/tokenize and serves per-function facts from a cache."""
+    cache = {}
+
+    def __init__(self, source):
+        self.functions = {}
+        tree = ast.parse(source)
+        tokens = [
+            (token.start[0], token.string)
+            for token in tokenize.generate_tokens(io.StringIO(source).readline)
+            if token.type == tokenize.NAME and keyword.iskeyword(token.string)
+        ]
+        for node in ast.walk(tree):
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                keywords = [name for line, name in tokens if node.lineno <= line <= node.end_lineno]
+                self.functions[node.name] = FunctionFacts(node.name, keywords, self.find_chains(node))
+
+    @staticmethod
+    def find_chains(function_node):
+        chains = []
+        continuations = set()
+        for node in ast.walk(function_node):
+            if not isinstance(node, ast.If):
+                continue
+            if len(node.orelse) == 1 and isinstance(node.orelse[0], ast.If):
+                continuations.add(id(node.orelse[0]))
+        for node in ast.walk(function_node):
+            if not isinstance(node, ast.If) or id(node) in continuations:
+                continue
+            elif_count = 0
+            current = node
+            while len(current.orelse) == 1 and isinstance(current.orelse[0], ast.If):
+                elif_count += 1
+                current = current.orelse[0]
+            chains.append((elif_count, bool(current.orelse)))
+        return chains
+
+    @classmethod
+    def for_module(cls, module):
+        """Return the cached analyzer for a module's current source, parsing it on first use.
+
+        The cache is keyed on a hash of the source, so a reloaded or edited
+        submission is analyzed afresh instead of reusing facts for old code.
+        """
+        source = inspect.getsource(module)
+        key = (getattr(module, "__file__", None) or module.__name__, hashlib.sha256(source.encode("utf-8")).hexdigest())
+        if key not in cls.cache:
+            cls.cache[key] = cls(source)
+        return cls.cache[key]
+
+    def facts(self, function_name):
+        """Return FunctionFacts for a function, or None when it is not defined in the module."""
+        return self.functions.get(function_name)
@@ -5,6 +5,7 @@ import sys
 import io
 import contextlib
 from test.TestUtils import TestUtils
+from test.BulkCaller import BulkCaller
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
@@ -117,8 +118,9 @@ class TestPlantCareBoundary(unittest.TestCase):
                     (3, 2, "Flowering (middle value) should return 2 days")
                 ]
                 
-                for plant_type, expected, message in watering_boundary_tests:
-                    result = safely_call_function(self.module_obj, "calculate_watering_schedule", plant_type)
+                outcomes = BulkCaller.run(self.module_obj, [("calculate_watering_schedule", [plant_type]) for plant_type, expected, message in watering_boundary_tests])
+                for (plant_type, expected, message), outcome in zip(watering_boundary_tests, outcomes):
+                    result = outcome.result
                     if result is None:
                         errors.append(f"calculate_watering_schedule({plant_type}) returned None")
                     elif not isinstance(result, int):
@@ -148,8 +150,9 @@ class TestPlantCareBoundary(unittest.TestCase):
                     (8, 3, 8, "Fall adjustment maintaining original")
                 ]
                 
-                for days, season, expected, description in season_boundary_tests:
-                    result = safely_call_function(self.module_obj, "adjust_for_season", days, season)
+                outcomes = BulkCaller.run(self.module_obj, [("adjust_for_season", [days, season]) for days, season, expected, description in season_boundary_tests])
+                for (days, season, expected, description), outcome in zip(season_boundary_tests, outcomes):
+                    result = outcome.result
                     if result is None:
                         errors.append(f"adjust_for_season({days}, {season}) returned None")
                     elif not isinstance(result, int):
@@ -178,8 +181,9 @@ class TestPlantCareBoundary(unittest.TestCase):
                     (28.0, "optimal", "Warm but optimal temperature")
                 ]
                 
-                for temperature, expected_keyword, description in temperature_boundary_tests:
-                    result = safely_call_function(self.module_obj, "check_temperature", temperature)
+                outcomes = BulkCaller.run(self.module_obj, [("check_temperature", [temperature]) for temperature, expected_keyword, description in temperature_boundary_tests])
+                for (temperature, expected_keyword, description), outcome in zip(temperature_boundary_tests, outcomes):
+                    result = outcome.result
                     if result is None:
                         errors.append(f"check_temperature({temperature}) returned None")
                     elif not isinstance(result, str):
@@ -211,8 +215,9 @@ class TestPlantCareBoundary(unittest.TestCase):
                     (99, "High", "fungal", "Near maximum humidity")
                 ]
                 
-                for humidity, expected_level, expected_advice, description in humidity_boundary_tests:
-                    result = safely_call_function(self.module_obj, "determine_humidity_needs", humidity)
+                outcomes = BulkCaller.run(self.module_obj, [("determine_humidity_needs", [humidity]) for humidity, expected_level, expected_advice, description in humidity_boundary_tests])
+                for (humidity, expected_level, expected_advice, description), outcome in zip(humidity_boundary_tests, outcomes):
+                    result = outcome.result
                     if result is None:
                         errors.append(f"determine_humidity_needs({humidity}) returned None")
                     elif not isinstance(result, tuple) or len(result) != 2:
@@ -241,8 +246,9 @@ class TestPlantCareBoundary(unittest.TestCase):
                     (3, ["full sun"], "Flowering (middle value) should need full sun")
                 ]
                 
-                for plant_type, expected_keywords, description in sunlight_boundary_tests:
-                    result = safely_call_function(self.module_obj, "get_sunlight_requirement", plant_type)
+                outcomes = BulkCaller.run(self.module_obj, [("get_sunlight_requirement", [plant_type]) for plant_type, expected_keywords, description in sunlight_boundary_tests])
+                for (plant_type, expected_keywords, description), outcome in zip(sunlight_boundary_tests, outcomes):
+                    result = outcome.result
                     if result is None:
                         errors.append(f"get_sunlight_requirement({plant_type}) returned None")
                     elif not isinstance(result, str):
@@ -303,4 +309,4 @@ class TestPlantCareBoundary(unittest.TestCase):
             print("TestComprehensiveBoundaryScenarios = Failed")
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
\ No newline at end of file
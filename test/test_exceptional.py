@@ -5,6 +5,7 @@ import sys
 import io
 import contextlib
 from test.TestUtils import TestUtils
+from test.BulkCaller import BulkCaller
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
@@ -132,9 +133,10 @@ class TestPlantCareException(unittest.TestCase):
             
             for func_name in plant_functions:
                 if check_function_exists(self.module_obj, func_name):
-                    for plant_type, description in plant_range_tests:
-                        if not check_raises_exception(getattr(self.module_obj, func_name), [plant_type], ValueError):
-                            errors.append(f"{func_name} does not raise ValueError for plant type {plant_type}: {description}")
+                    cases = [(func_name, [plant_type], description) for plant_type, description in plant_range_tests]
+                    for outcome in BulkCaller.run(self.module_obj, cases):
+                        if not outcome.raised(ValueError):
+                            errors.append(f"{func_name} does not raise ValueError for plant type {outcome.args[0]}: {outcome.case[2]}")
                 else:
                     errors.append(f"{func_name} function not found")
             
@@ -147,12 +149,14 @@ class TestPlantCareException(unittest.TestCase):
                     (7, 10, "Season 10 should raise ValueError (way too high)")
                 ]
                 
-                for days, season, description in season_range_tests:
-                    if not check_raises_exception(self.module_obj.adjust_for_season, [days, season], ValueError):
-                        errors.append(f"adjust_for_season does not raise ValueError for season {season}: {description}")
+                cases = [("adjust_for_season", [days, season], description) for days, season, description in season_range_tests]
+                outcomes = BulkCaller.run(self.module_obj, cases + [("adjust_for_season", [-1, 2])])
+                for outcome in outcomes[:-1]:
+                    if not outcome.raised(ValueError):
+                        errors.append(f"adjust_for_season does not raise ValueError for season {outcome.args[1]}: {outcome.case[2]}")
                 
                 # Test negative days
-                if not check_raises_exception(self.module_obj.adjust_for_season, [-1, 2], ValueError):
+                if not outcomes[-1].raised(ValueError):
                     errors.append("adjust_for_season does not raise ValueError for negative days")
             else:
                 errors.append("adjust_for_season function not found")
@@ -166,9 +170,10 @@ class TestPlantCareException(unittest.TestCase):
                     (100.0, "Temperature 100.0 should raise ValueError (extremely hot)")
                 ]
                 
-                for temperature, description in temp_range_tests:
-                    if not check_raises_exception(self.module_obj.check_temperature, [temperature], ValueError):
-                        errors.append(f"check_temperature does not raise ValueError for temperature {temperature}: {description}")
+                cases = [("check_temperature", [temperature], description) for temperature, description in temp_range_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"check_temperature does not raise ValueError for temperature {outcome.args[0]}: {outcome.case[2]}")
             else:
                 errors.append("check_temperature function not found")
             
@@ -181,9 +186,10 @@ class TestPlantCareException(unittest.TestCase):
                     (200, "Humidity 200 should raise ValueError (way too high)")
                 ]
                 
-                for humidity, description in humidity_range_tests:
-                    if not check_raises_exception(self.module_obj.determine_humidity_needs, [humidity], ValueError):
-                        errors.append(f"determine_humidity_needs does not raise ValueError for humidity {humidity}: {description}")
+                cases = [("determine_humidity_needs", [humidity], description) for humidity, description in humidity_range_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"determine_humidity_needs does not raise ValueError for humidity {outcome.args[0]}: {outcome.case[2]}")
             else:
                 errors.append("determine_humidity_needs function not found")
             
@@ -202,23 +208,26 @@ class TestPlantCareException(unittest.TestCase):
             # Plant type validation for calculate_watering_schedule and get_sunlight_requirement
             for func_name in plant_functions:
                 if check_function_exists(self.module_obj, func_name):
-                    for invalid_input, description in invalid_types:
-                        if not check_raises_exception(getattr(self.module_obj, func_name), [invalid_input], ValueError):
-                            errors.append(f"{func_name} does not raise ValueError for {type(invalid_input).__name__} input: {description}")
+                    cases = [(func_name, [invalid_input], description) for invalid_input, description in invalid_types]
+                    for outcome in BulkCaller.run(self.module_obj, cases):
+                        if not outcome.raised(ValueError):
+                            errors.append(f"{func_name} does not raise ValueError for {type(outcome.args[0]).__name__} input: {outcome.case[2]}")
                 else:
                     errors.append(f"{func_name} function not found")
             
             # Season and days validation for adjust_for_season
             if check_function_exists(self.module_obj, "adjust_for_season"):
                 # Test invalid days types
-                for invalid_input, description in invalid_types:
-                    if not check_raises_exception(self.module_obj.adjust_for_season, [invalid_input, 2], ValueError):
-                        errors.append(f"adjust_for_season does not raise ValueError for {type(invalid_input).__name__} days: {description}")
+                cases = [("adjust_for_season", [invalid_input, 2], description) for invalid_input, description in invalid_types]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"adjust_for_season does not raise ValueError for {type(outcome.args[0]).__name__} days: {outcome.case[2]}")
                 
                 # Test invalid season types
-                for invalid_input, description in invalid_types:
-                    if not check_raises_exception(self.module_obj.adjust_for_season, [7, invalid_input], ValueError):
-                        errors.append(f"adjust_for_season does not raise ValueError for {type(invalid_input).__name__} season: {description}")
+                cases = [("adjust_for_season", [7, invalid_input], description) for invalid_input, description in invalid_types]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"adjust_for_season does not raise ValueError for {type(outcome.args[1]).__name__} season: {outcome.case[2]}")
             else:
                 errors.append("adjust_for_season function not found")
             
@@ -233,17 +242,19 @@ class TestPlantCareException(unittest.TestCase):
                     (True, "Boolean temperature should raise ValueError")
                 ]
                 
-                for invalid_temp, description in temp_invalid_types:
-                    if not check_raises_exception(self.module_obj.check_temperature, [invalid_temp], ValueError):
-                        errors.append(f"check_temperature does not raise ValueError for {type(invalid_temp).__name__} input: {description}")
+                cases = [("check_temperature", [invalid_temp], description) for invalid_temp, description in temp_invalid_types]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"check_temperature does not raise ValueError for {type(outcome.args[0]).__name__} input: {outcome.case[2]}")
             else:
                 errors.append("check_temperature function not found")
             
             # Humidity validation
             if check_function_exists(self.module_obj, "determine_humidity_needs"):
-                for invalid_input, description in invalid_types:
-                    if not check_raises_exception(self.module_obj.determine_humidity_needs, [invalid_input], ValueError):
-                        errors.append(f"determine_humidity_needs does not raise ValueError for {type(invalid_input).__name__} input: {description}")
+                cases = [("determine_humidity_needs", [invalid_input], description) for invalid_input, description in invalid_types]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"determine_humidity_needs does not raise ValueError for {type(outcome.args[0]).__name__} input: {outcome.case[2]}")
             else:
                 errors.append("determine_humidity_needs function not found")
             
@@ -261,9 +272,10 @@ class TestPlantCareException(unittest.TestCase):
                     (True, 1, 25.0, 50, "Boolean plant type should raise ValueError")
                 ]
                 
-                for plant_type, season, temp, humidity, description in plant_type_tests:
-                    if not check_raises_exception(self.module_obj.generate_care_instructions, [plant_type, season, temp, humidity], ValueError):
-                        errors.append(f"generate_care_instructions does not raise ValueError: {description}")
+                cases = [("generate_care_instructions", case[:4], case[4]) for case in plant_type_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"generate_care_instructions does not raise ValueError: {outcome.case[2]}")
                 
                 # Test invalid seasons
                 season_tests = [
@@ -276,9 +288,10 @@ class TestPlantCareException(unittest.TestCase):
                     (1, True, 25.0, 50, "Boolean season should raise ValueError")
                 ]
                 
-                for plant_type, season, temp, humidity, description in season_tests:
-                    if not check_raises_exception(self.module_obj.generate_care_instructions, [plant_type, season, temp, humidity], ValueError):
-                        errors.append(f"generate_care_instructions does not raise ValueError: {description}")
+                cases = [("generate_care_instructions", case[:4], case[4]) for case in season_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"generate_care_instructions does not raise ValueError: {outcome.case[2]}")
                 
                 # Test invalid temperatures
                 temp_tests = [
@@ -291,9 +304,10 @@ class TestPlantCareException(unittest.TestCase):
                     (1, 1, True, 50, "Boolean temperature should raise ValueError")
                 ]
                 
-                for plant_type, season, temp, humidity, description in temp_tests:
-                    if not check_raises_exception(self.module_obj.generate_care_instructions, [plant_type, season, temp, humidity], ValueError):
-                        errors.append(f"generate_care_instructions does not raise ValueError: {description}")
+                cases = [("generate_care_instructions", case[:4], case[4]) for case in temp_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"generate_care_instructions does not raise ValueError: {outcome.case[2]}")
                 
                 # Test invalid humidity
                 humidity_tests = [
@@ -306,9 +320,10 @@ class TestPlantCareException(unittest.TestCase):
                     (1, 1, 25.0, True, "Boolean humidity should raise ValueError")
                 ]
                 
-                for plant_type, season, temp, humidity, description in humidity_tests:
-                    if not check_raises_exception(self.module_obj.generate_care_instructions, [plant_type, season, temp, humidity], ValueError):
-                        errors.append(f"generate_care_instructions does not raise ValueError: {description}")
+                cases = [("generate_care_instructions", case[:4], case[4]) for case in humidity_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"generate_care_instructions does not raise ValueError: {outcome.case[2]}")
             else:
                 errors.append("generate_care_instructions function not found")
             
@@ -331,16 +346,12 @@ class TestPlantCareException(unittest.TestCase):
                 ("generate_care_instructions", [4, 4, 50.0, 100], "Maximum boundary values should be valid")
             ]
             
-            for func_name, args, description in valid_edge_cases:
-                if check_function_exists(self.module_obj, func_name):
-                    try:
-                        result = safely_call_function(self.module_obj, func_name, *args)
-                        if result is None:
-                            errors.append(f"{func_name} returned None for valid edge case: {description}")
-                    except Exception as e:
-                        errors.append(f"{func_name} raised unexpected exception for valid edge case {description}: {str(e)}")
-                else:
+            for outcome in BulkCaller.run(self.module_obj, valid_edge_cases):
+                func_name, description = outcome.function_name, outcome.case[2]
+                if outcome.missing:
                     errors.append(f"Function {func_name} not found")
+                elif outcome.result is None:
+                    errors.append(f"{func_name} returned None for valid edge case: {description}")
             
             # === ADDITIONAL BOOLEAN INPUT VALIDATION ===
             
@@ -361,12 +372,12 @@ class TestPlantCareException(unittest.TestCase):
                 ("check_temperature", [False], "Boolean False temperature should raise ValueError")
             ]
             
-            for func_name, args, description in boolean_tests:
-                if check_function_exists(self.module_obj, func_name):
-                    if not check_raises_exception(getattr(self.module_obj, func_name), args, ValueError):
-                        errors.append(f"{func_name} does not raise ValueError: {description}")
-                else:
+            for outcome in BulkCaller.run(self.module_obj, boolean_tests):
+                func_name, description = outcome.function_name, outcome.case[2]
+                if outcome.missing:
                     errors.append(f"Function {func_name} not found for boolean test")
+                elif not outcome.raised(ValueError):
+                    errors.append(f"{func_name} does not raise ValueError: {description}")
             
             # === COMPREHENSIVE GENERATE_CARE_INSTRUCTIONS BOOLEAN TESTS ===
             
@@ -382,9 +393,10 @@ class TestPlantCareException(unittest.TestCase):
                     (1, 1, 25.0, False, "Boolean False humidity should raise ValueError")
                 ]
                 
-                for plant_type, season, temp, humidity, description in comprehensive_boolean_tests:
-                    if not check_raises_exception(self.module_obj.generate_care_instructions, [plant_type, season, temp, humidity], ValueError):
-                        errors.append(f"generate_care_instructions does not raise ValueError: {description}")
+                cases = [("generate_care_instructions", case[:4], case[4]) for case in comprehensive_boolean_tests]
+                for outcome in BulkCaller.run(self.module_obj, cases):
+                    if not outcome.raised(ValueError):
+                        errors.append(f"generate_care_instructions does not raise ValueError: {outcome.case[2]}")
             
             # === EXTREME VALUE TESTS ===
             
@@ -403,12 +415,12 @@ class TestPlantCareException(unittest.TestCase):
                 ("get_sunlight_requirement", [999], "Extreme positive plant type should raise ValueError")
             ]
             
-            for func_name, args, description in extreme_tests:
-                if check_function_exists(self.module_obj, func_name):
-                    if not check_raises_exception(getattr(self.module_obj, func_name), args, ValueError):
-                        errors.append(f"{func_name} does not raise ValueError: {description}")
-                else:
+            for outcome in BulkCaller.run(self.module_obj, extreme_tests):
+                func_name, description = outcome.function_name, outcome.case[2]
+                if outcome.missing:
                     errors.append(f"Function {func_name} not found for extreme test")
+                elif not outcome.raised(ValueError):
+                    errors.append(f"{func_name} does not raise ValueError: {description}")
             
             # Final result checking
             if errors:
@@ -423,4 +435,4 @@ class TestPlantCareException(unittest.TestCase):
             print("TestComprehensiveExceptionHandling = Failed")
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
\ No newline at end of file
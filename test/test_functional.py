@@ -4,9 +4,9 @@ import importlib
 import sys
 import io
 import contextlib
-import re
-import inspect
 from test.TestUtils import TestUtils
+from test.BulkCaller import BulkCaller
+from test.StructureAnalyzer import StructureAnalyzer
 
 def check_file_exists(filename):
     """Check if a file exists in the current directory."""
@@ -93,10 +93,10 @@ class TestPlantCareFunctional(unittest.TestCase):
             
             # Check if all required functions exist
             functions_to_check = {
-                'calculate_watering_schedule': r'if.*elif.*elif.*elif',
-                'adjust_for_season': r'if.*elif.*else',
-                'check_temperature': r'if.*elif.*else',
-                'determine_humidity_needs': r'if.*elif.*else'
+                'calculate_watering_schedule': ["if", "elif", "elif", "elif"],
+                'adjust_for_season': ["if", "elif", "else"],
+                'check_temperature': ["if", "elif", "else"],
+                'determine_humidity_needs': ["if", "elif", "else"]
             }
             
             missing_functions = []
@@ -110,14 +110,16 @@ class TestPlantCareFunctional(unittest.TestCase):
                 print("TestFunctionStructureAndImplementation = Failed")
                 return
             
+            # Parse the module once; every structural check below reads from this cache
+            analyzer = StructureAnalyzer.for_module(self.module_obj)
+
             # Check function implementations for required conditional structures
-            for func_name, pattern in functions_to_check.items():
+            for func_name, sequence in functions_to_check.items():
                 try:
-                    if check_function_exists(self.module_obj, func_name):
-                        func = getattr(self.module_obj, func_name)
-                        code = inspect.getsource(func)
-                        if not re.search(pattern, code.replace('\n', ' '), re.DOTALL):
-                            errors.append(f"{func_name} missing {pattern} structure")
+                    facts = analyzer.facts(func_name)
+                    if facts is not None:
+                        if not facts.has_sequence(sequence):
+                            errors.append(f"{func_name} missing {'-'.join(sequence)} structure")
                     else:
                         errors.append(f"Function {func_name} not found")
                 except Exception as e:
@@ -125,7 +127,7 @@ class TestPlantCareFunctional(unittest.TestCase):
             
             # === IMPLEMENTATION TECHNIQUES TESTING ===
             
-            # Check implementation techniques using source code inspection
+            # Check implementation techniques using the parsed structure
             implementation_checks = [
                 ("calculate_watering_schedule", ["if", "elif"], "Should use if-elif structure for plant types"),
                 ("adjust_for_season", ["if", "elif", "else"], "Should use if-elif-else structure for seasons"),
@@ -136,14 +138,11 @@ class TestPlantCareFunctional(unittest.TestCase):
             
             for func_name, required_keywords, description in implementation_checks:
                 try:
-                    if check_function_exists(self.module_obj, func_name):
-                        func = getattr(self.module_obj, func_name)
-                        source = inspect.getsource(func)
-                        source_lower = source.lower()
-                        
+                    facts = analyzer.facts(func_name)
+                    if facts is not None:
                         missing_keywords = []
                         for keyword in required_keywords:
-                            if keyword not in source_lower:
+                            if not facts.uses(keyword):
                                 missing_keywords.append(keyword)
                         
                         if missing_keywords:
@@ -151,16 +150,16 @@ class TestPlantCareFunctional(unittest.TestCase):
                             
                         # Check for proper conditional structure patterns
                         if func_name == "calculate_watering_schedule":
-                            elif_count = source_lower.count("elif")
+                            elif_count = facts.count("elif")
                             if elif_count < 2:
                                 errors.append(f"{func_name} should have at least 3 elif statements for 4 plant types")
                         
                         elif func_name == "adjust_for_season":
-                            if "else" not in source_lower:
+                            if not facts.uses("else"):
                                 errors.append(f"{func_name} should have else clause for default seasons")
                         
                         elif func_name in ["check_temperature", "determine_humidity_needs"]:
-                            if source_lower.count("if") < 2:
+                            if facts.count("if") + facts.count("elif") < 2:
                                 errors.append(f"{func_name} should have multiple conditional checks")
                     
                 except Exception as e:
@@ -178,14 +177,11 @@ class TestPlantCareFunctional(unittest.TestCase):
             for func_name, test_cases, description in logic_tests:
                 if check_function_exists(self.module_obj, func_name):
                     results = []
-                    for test_case in test_cases:
-                        if len(test_case) == 2:  # Single argument functions
-                            arg, expected_substring = test_case
-                            result = safely_call_function(self.module_obj, func_name, arg)
-                        else:  # Multi-argument functions
-                            args = test_case[:-1]
-                            expected_substring = test_case[-1]
-                            result = safely_call_function(self.module_obj, func_name, *args)
+                    # Every test case is (*args, expected)
+                    outcomes = BulkCaller.run(self.module_obj, [(func_name, list(test_case[:-1])) for test_case in test_cases])
+                    for test_case, outcome in zip(test_cases, outcomes):
+                        expected_substring = test_case[-1]
+                        result = outcome.result
                         
                         if result is None:
                             errors.append(f"{func_name} returned None for test case {test_case}")
@@ -266,8 +262,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 (4, 1, "Herb should be watered every 1 day")
             ]
             
-            for plant_type, expected, message in watering_tests:
-                result = safely_call_function(self.module_obj, "calculate_watering_schedule", plant_type)
+            outcomes = BulkCaller.run(self.module_obj, [("calculate_watering_schedule", [plant_type]) for plant_type, expected, message in watering_tests])
+            for (plant_type, expected, message), outcome in zip(watering_tests, outcomes):
+                result = outcome.result
                 if result is None:
                     errors.append(f"calculate_watering_schedule({plant_type}) returned None")
                 elif not isinstance(result, int):
@@ -288,8 +285,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 (5, 3, 5, "Fall adjustment should not change")
             ]
             
-            for days, season, expected, message in season_tests:
-                result = safely_call_function(self.module_obj, "adjust_for_season", days, season)
+            outcomes = BulkCaller.run(self.module_obj, [("adjust_for_season", [days, season]) for days, season, expected, message in season_tests])
+            for (days, season, expected, message), outcome in zip(season_tests, outcomes):
+                result = outcome.result
                 if result is None:
                     errors.append(f"adjust_for_season({days}, {season}) returned None")
                 elif not isinstance(result, int):
@@ -315,8 +313,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 ("generate_care_instructions", [2, 1, 25.0, 50], str, "Should return string for care instructions")
             ]
             
-            for func_name, args, expected_type, description in type_tests:
-                result = safely_call_function(self.module_obj, func_name, *args)
+            outcomes = BulkCaller.run(self.module_obj, type_tests)
+            for (func_name, args, expected_type, description), outcome in zip(type_tests, outcomes):
+                result = outcome.result
                 if result is None:
                     errors.append(f"{func_name} returned None when it should return {expected_type.__name__}: {description}")
                 elif not isinstance(result, expected_type):
@@ -342,8 +341,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 ("generate_care_instructions", [1, 1, 25.0, 50], lambda x: len(x) > 100, "Care instructions should be comprehensive")
             ]
             
-            for func_name, args, validator, description in range_tests:
-                result = safely_call_function(self.module_obj, func_name, *args)
+            outcomes = BulkCaller.run(self.module_obj, range_tests)
+            for (func_name, args, validator, description), outcome in zip(range_tests, outcomes):
+                result = outcome.result
                 if result is not None:
                     try:
                         if not validator(result):
@@ -359,9 +359,10 @@ class TestPlantCareFunctional(unittest.TestCase):
                 ("calculate_watering_schedule", [4], lambda x: x > 0, "All plant types should return positive days")
             ]
             
-            for func_name, args, validator, description in boundary_tests:
-                if check_function_exists(self.module_obj, func_name):
-                    result = safely_call_function(self.module_obj, func_name, *args)
+            outcomes = BulkCaller.run(self.module_obj, boundary_tests)
+            for (func_name, args, validator, description), outcome in zip(boundary_tests, outcomes):
+                if not outcome.missing:
+                    result = outcome.result
                     if result is None:
                         errors.append(f"{func_name} returned None for boundary test: {description}")
                     elif not validator(result):
@@ -426,8 +427,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 (-10.0, "low", "Minimum allowed temperature should be low")
             ]
             
-            for temp, expected_text, message in temp_tests:
-                result = safely_call_function(self.module_obj, "check_temperature", temp)
+            outcomes = BulkCaller.run(self.module_obj, [("check_temperature", [temp]) for temp, expected_text, message in temp_tests])
+            for (temp, expected_text, message), outcome in zip(temp_tests, outcomes):
+                result = outcome.result
                 if result is None:
                     errors.append(f"check_temperature({temp}) returned None")
                 elif not isinstance(result, str):
@@ -448,8 +450,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 (100, "High", "fungal", "Maximum humidity should be High")
             ]
             
-            for humid, expected_level, expected_advice, message in humidity_tests:
-                result = safely_call_function(self.module_obj, "determine_humidity_needs", humid)
+            outcomes = BulkCaller.run(self.module_obj, [("determine_humidity_needs", [humid]) for humid, expected_level, expected_advice, message in humidity_tests])
+            for (humid, expected_level, expected_advice, message), outcome in zip(humidity_tests, outcomes):
+                result = outcome.result
                 if result is None:
                     errors.append(f"determine_humidity_needs({humid}) returned None")
                 elif not isinstance(result, tuple) or len(result) != 2:
@@ -469,8 +472,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 (4, ["direct", "hours"], "Herb should need direct sunlight with hours specified")
             ]
             
-            for plant_type, expected_texts, message in sunlight_tests:
-                result = safely_call_function(self.module_obj, "get_sunlight_requirement", plant_type)
+            outcomes = BulkCaller.run(self.module_obj, [("get_sunlight_requirement", [plant_type]) for plant_type, expected_texts, message in sunlight_tests])
+            for (plant_type, expected_texts, message), outcome in zip(sunlight_tests, outcomes):
+                result = outcome.result
                 if result is None:
                     errors.append(f"get_sunlight_requirement({plant_type}) returned None")
                 elif not isinstance(result, str):
@@ -521,8 +525,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 4: "Harvest regularly to promote growth"  # Herb
             }
             
-            for plant_type, expected_care in plant_instructions.items():
-                instructions = safely_call_function(self.module_obj, "generate_care_instructions", plant_type, 1, 25.0, 45)
+            outcomes = BulkCaller.run(self.module_obj, [("generate_care_instructions", [plant_type, 1, 25.0, 45]) for plant_type in plant_instructions])
+            for (plant_type, expected_care), outcome in zip(plant_instructions.items(), outcomes):
+                instructions = outcome.result
                 if instructions is None:
                     errors.append(f"generate_care_instructions returned None for plant type {plant_type}")
                 elif not isinstance(instructions, str):
@@ -536,8 +541,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 4: "Reduce watering frequency"     # Winter
             }
             
-            for season, expected_advice in seasonal_advice.items():
-                instructions = safely_call_function(self.module_obj, "generate_care_instructions", 1, season, 25.0, 45)
+            outcomes = BulkCaller.run(self.module_obj, [("generate_care_instructions", [1, season, 25.0, 45]) for season in seasonal_advice])
+            for (season, expected_advice), outcome in zip(seasonal_advice.items(), outcomes):
+                instructions = outcome.result
                 if instructions is None:
                     errors.append(f"generate_care_instructions returned None for season {season}")
                 elif not isinstance(instructions, str):
@@ -572,11 +578,14 @@ class TestPlantCareFunctional(unittest.TestCase):
                 (80, "fungal", "High humidity should warn about fungal growth")
             ]
             
-            for condition_value, expected_keyword, description in environmental_tests:
-                if "temperature" in description.lower():
-                    instructions = safely_call_function(self.module_obj, "generate_care_instructions", 1, 1, condition_value, 45)
-                else:  # humidity test
-                    instructions = safely_call_function(self.module_obj, "generate_care_instructions", 1, 1, 25.0, condition_value)
+            cases = [
+                ("generate_care_instructions", [1, 1, condition_value, 45] if "temperature" in description.lower()
+                 else [1, 1, 25.0, condition_value])  # humidity test
+                for condition_value, expected_keyword, description in environmental_tests
+            ]
+            outcomes = BulkCaller.run(self.module_obj, cases)
+            for (condition_value, expected_keyword, description), outcome in zip(environmental_tests, outcomes):
+                instructions = outcome.result
                 
                 if instructions is None:
                     errors.append(f"generate_care_instructions returned None for {description}")
@@ -755,8 +764,9 @@ class TestPlantCareFunctional(unittest.TestCase):
                 ]
                 
                 # Test individual functions
-                for func_name, args in functions_to_test:
-                    result = safely_call_function(self.module_obj, func_name, *args)
+                outcomes = BulkCaller.run(self.module_obj, functions_to_test)
+                for (func_name, args), outcome in zip(functions_to_test, outcomes):
+                    result = outcome.result
                     if result is None:
                         errors.append(f"Integration scenario failed: {func_name} returned None for {description}")
                 
@@ -0,0 +1,62 @@
+import unittest
+import numpy as np
+import care_records
+import care_rules
+from care_records import PlantReading, TemperatureStatus
+
+class TestTemperatureQuantization(unittest.TestCase):
+    """Test that storing temperatures in tenths never moves a reading across a band edge."""
+
+    EDGE_CASES = [
+        (9.94, 99, TemperatureStatus.LOW),
+        (9.96, 99, TemperatureStatus.LOW),
+        (10.0, 100, TemperatureStatus.OPTIMAL),
+        (10.04, 100, TemperatureStatus.OPTIMAL),
+        (29.96, 300, TemperatureStatus.OPTIMAL),
+        (30.0, 300, TemperatureStatus.OPTIMAL),
+        (30.04, 301, TemperatureStatus.HIGH),
+        (30.06, 301, TemperatureStatus.HIGH),
+        (-10.0, -100, TemperatureStatus.LOW),
+        (50.0, 500, TemperatureStatus.HIGH),
+    ]
+
+    def test_scalar_reading_keeps_its_band(self):
+        for temperature, tenths, status in self.EDGE_CASES:
+            reading = PlantReading(1, 1, temperature, 50)
+            self.assertEqual(reading.temperature_tenths, tenths, temperature)
+            self.assertEqual(reading.evaluate().temperature_status, status, temperature)
+
+    def test_packed_array_keeps_its_band(self):
+        temperatures = [case[0] for case in self.EDGE_CASES]
+        readings = np.zeros(len(temperatures), dtype=care_records.READING_DTYPE)
+        readings["plant_type"] = 1
+        readings["season"] = 1
+        readings["temperature"] = care_records.to_tenths_array(temperatures)
+        readings["humidity"] = 50
+        self.assertEqual(readings["temperature"].tolist(), [case[1] for case in self.EDGE_CASES])
+        advice = care_records.evaluate_array(readings)
+        self.assertEqual(advice["temperature_status"].tolist(), [int(case[2]) for case in self.EDGE_CASES])
+
+class TestAdviceRendering(unittest.TestCase):
+    """Test that Advice renders the codes it holds."""
+
+    def test_render_matches_rules(self):
+        for plant_type in range(1, 5):
+            advice = care_records.generate_advice(plant_type, 4, 35.0, 20)
+            self.assertEqual(str(advice), care_rules.advise(plant_type, 4, 35.0, 20))
+
+    def test_render_uses_held_fields(self):
+        advice = care_records.generate_advice(2, 1, 20.0, 50)
+        advice.watering_days = 9
+        lines = str(advice).splitlines()
+        self.assertEqual(lines[0], "Watering Schedule: Every 9 days")
+        self.assertIn(care_rules.PLANT_CARE[1], lines)
+
+    def test_packed_advice_keeps_plant_type(self):
+        readings = care_records.to_array([PlantReading(3, 2, 25.0, 70)])
+        advice = care_records.advice_at(care_records.evaluate_array(readings), 0)
+        self.assertEqual(advice, PlantReading(3, 2, 25.0, 70).evaluate())
+        self.assertEqual(advice.plant_type, care_records.PlantType.FLOWERING)
+
+if __name__ == '__main__':
+    unittest.main()
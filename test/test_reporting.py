@@ -0,0 +1,211 @@
+import unittest
+import json
+import os
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from test.TestUtils import TestUtils
+from test.ResultPusher import ResultPusher
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Records every POST body and answers 200."""
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.server.bodies.append(json.loads(self.rfile.read(length)))
+        self.server.connections.add(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+class SlowHandler(StandInHandler):
+    """Answers only after the server's delay, like an overloaded endpoint."""
+
+    def do_POST(self):
+        time.sleep(self.server.delay)
+        super().do_POST()
+
+class TestBatchedReporting(unittest.TestCase):
+    """Test batched result submission in TestUtils against a local stand-in server."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.bodies = []
+        self.server.connections = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+        custom = tempfile.NamedTemporaryFile("w", suffix=".ih", delete=False)
+        custom.write("custom-data")
+        custom.close()
+        self.custom_path = custom.name
+
+        self.saved = {name: getattr(TestUtils, name) for name in ("URL", "CUSTOM_FILE", "BATCH", "customData", "session")}
+        TestUtils.URL = f"http://127.0.0.1:{self.server.server_address[1]}/push"
+        TestUtils.CUSTOM_FILE = self.custom_path
+        TestUtils.BATCH = True
+        TestUtils.customData = None
+        TestUtils.session = None
+        TestUtils.pending.clear()
+        self.saved_spool = os.environ.get("YAKSHA_SPOOL_FILE")
+        self.spool_file = self.custom_path + ".spool.jsonl"
+        os.environ["YAKSHA_SPOOL_FILE"] = self.spool_file
+
+    def tearDown(self):
+        if TestUtils.session is not None:
+            TestUtils.session.close()
+        for name, value in self.saved.items():
+            setattr(TestUtils, name, value)
+        TestUtils.pending.clear()
+        if self.saved_spool is None:
+            del os.environ["YAKSHA_SPOOL_FILE"]
+        else:
+            os.environ["YAKSHA_SPOOL_FILE"] = self.saved_spool
+        for path in (self.spool_file, self.spool_file + ".lock"):
+            if os.path.exists(path):
+                os.remove(path)
+        self.server.shutdown()
+        self.server.server_close()
+        os.remove(self.custom_path)
+
+    def test_batched_results_are_sent_in_one_post(self):
+        TestUtils.yakshaAssert("TestOne", True, "functional")
+        TestUtils.yakshaAssert("TestTwo", False, "boundary")
+        TestUtils.yakshaAssert("TestThree", True, "exceptional")
+        self.assertEqual(self.server.bodies, [])
+
+        TestUtils.flush()
+        self.assertEqual(len(self.server.bodies), 1)
+        results = self.server.bodies[0]
+        self.assertEqual(len(results), 3)
+        self.assertTrue(all(result["customData"] == "custom-data" for result in results))
+        first = json.loads(results[0]["testCaseResults"])[TestUtils.GUID]
+        second = json.loads(results[1]["testCaseResults"])[TestUtils.GUID]
+        self.assertEqual((first["methodName"], first["status"]), ("TestOne", "Passed"))
+        self.assertEqual((second["methodName"], second["status"]), ("TestTwo", "Failed"))
+
+    def test_custom_data_is_read_once(self):
+        TestUtils.yakshaAssert("TestOne", True, "functional")
+        os.remove(self.custom_path)
+        TestUtils.yakshaAssert("TestTwo", True, "functional")
+        open(self.custom_path, "w").close()
+        self.assertEqual(len(TestUtils.pending), 2)
+
+    def test_session_is_reused_across_flushes(self):
+        TestUtils.yakshaAssert("TestOne", True, "functional")
+        TestUtils.flush()
+        TestUtils.yakshaAssert("TestTwo", True, "functional")
+        TestUtils.flush()
+        self.assertEqual(len(self.server.bodies), 2)
+        self.assertEqual(len(self.server.connections), 1)
+
+    def test_flush_replays_spool_before_sending(self):
+        ResultPusher.write_spool(self.spool_file, [{"n": 1}, [{"n": 2}]])
+        TestUtils.yakshaAssert("TestOne", True, "functional")
+        TestUtils.flush()
+        self.assertEqual(len(self.server.bodies), 2)
+        self.assertEqual(self.server.bodies[0], [{"n": 1}, {"n": 2}])
+        self.assertEqual(len(self.server.bodies[1]), 1)
+        self.assertFalse(os.path.exists(self.spool_file))
+
+class TestResultPusher(unittest.TestCase):
+    """Test background delivery and the offline spool of ResultPusher."""
+
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+        self.server.bodies = []
+        self.server.connections = set()
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/push"
+        self.spool_file = os.path.join(tempfile.mkdtemp(), "spool.jsonl")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        directory = os.path.dirname(self.spool_file)
+        for name in os.listdir(directory):
+            os.remove(os.path.join(directory, name))
+        os.rmdir(directory)
+
+    def test_payloads_are_delivered_in_background(self):
+        pusher = ResultPusher(self.url, self.spool_file)
+        pusher.submit({"n": 1})
+        pusher.submit({"n": 2})
+        pusher.close()
+        self.assertEqual(self.server.bodies, [{"n": 1}, {"n": 2}])
+        self.assertFalse(os.path.exists(self.spool_file))
+
+    def test_unreachable_endpoint_spools_and_next_run_replays(self):
+        unreachable = ResultPusher("http://127.0.0.1:1/push", self.spool_file, timeout=1.0)
+        unreachable.submit({"n": 1})
+        unreachable.submit([{"n": 2}, {"n": 3}])
+        unreachable.close()
+        with open(self.spool_file) as f:
+            self.assertEqual(len(f.readlines()), 2)
+
+        pusher = ResultPusher(self.url, self.spool_file)
+        pusher.close()
+        self.assertEqual(self.server.bodies, [[{"n": 1}, {"n": 2}, {"n": 3}]])
+        self.assertFalse(os.path.exists(self.spool_file))
+
+    def test_corrupt_spool_line_is_quarantined(self):
+        with open(self.spool_file, "w") as f:
+            f.write(json.dumps({"n": 1}) + "\n" + '{"n": 2, "trunc')
+        pusher = ResultPusher(self.url, self.spool_file)
+        pusher.submit({"n": 3})
+        pusher.close()
+        self.assertEqual(self.server.bodies, [[{"n": 1}], {"n": 3}])
+        with open(self.spool_file + ".corrupt") as f:
+            self.assertEqual(f.read(), '{"n": 2, "trunc\n')
+        os.remove(self.spool_file + ".corrupt")
+
+    def test_close_spools_queue_when_worker_is_not_running(self):
+        class StoppedPusher(ResultPusher):
+            def run(self):
+                pass
+
+        pusher = StoppedPusher(self.url, self.spool_file)
+        pusher.worker.join()
+        pusher.submit({"n": 1})
+        pusher.submit({"n": 2})
+        pusher.close()
+        with open(self.spool_file) as f:
+            self.assertEqual([json.loads(line) for line in f], [{"n": 1}, {"n": 2}])
+
+    def test_close_spools_in_flight_payload_after_timeout(self):
+        slow = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+        slow.bodies = []
+        slow.connections = set()
+        slow.delay = 2.0
+        threading.Thread(target=slow.serve_forever, daemon=True).start()
+        try:
+            pusher = ResultPusher(f"http://127.0.0.1:{slow.server_address[1]}/push", self.spool_file)
+            pusher.EXIT_TIMEOUT = 0.2
+            pusher.submit({"n": 1})
+            pusher.submit({"n": 2})
+            time.sleep(0.2)
+            pusher.close()
+            with open(self.spool_file) as f:
+                self.assertEqual([json.loads(line) for line in f], [{"n": 1}, {"n": 2}])
+            pusher.worker.join(5)
+            with open(self.spool_file) as f:
+                self.assertEqual(len(f.readlines()), 2)
+        finally:
+            slow.shutdown()
+            slow.server_close()
+
+    def test_default_spool_is_private_to_user(self):
+        saved = os.environ.pop("YAKSHA_SPOOL_FILE", None)
+        try:
+            spool_file = ResultPusher.default_spool_file()
+        finally:
+            if saved is not None:
+                os.environ["YAKSHA_SPOOL_FILE"] = saved
+        self.assertEqual(os.stat(os.path.dirname(spool_file)).st_mode & 0o777, 0o700)
+
+if __name__ == '__main__':
+    unittest.main()